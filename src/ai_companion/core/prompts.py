@@ -120,8 +120,34 @@ Enhance the given prompt using the best prompt engineering techniques such as pr
 "realistic photo of a burger" -> "professional food photography of a gourmet burger with melted cheese, fresh lettuce, tomato, on artisan bun, wooden table, natural lighting, shot with 50mm f/1.8 lens, 8425.HEIC"
 """
 
-def get_character_card_prompt(language: str = "auto") -> str:
-    """Get the restaurant assistant prompt with language-specific instructions."""
+# Per-turn context of the character card. Kept separate so callers can send it
+# after the static card, leaving the card itself an identical prompt prefix
+CHARACTER_CONTEXT_PROMPT = """# Restaurant Information
+
+{restaurant_info}
+
+## Customer Background
+
+Here's what you know about this customer from previous conversations:
+
+{memory_context}
+
+## Current Status
+
+{current_activity}
+
+"""
+
+
+def get_character_card_prompt(language: str = "auto", include_context: bool = True) -> str:
+    """Get the restaurant assistant prompt with language-specific instructions.
+
+    Args:
+        language: Response language code, or "auto" to follow the customer
+        include_context: Embed the per-turn context sections in the card. When
+            False, send CHARACTER_CONTEXT_PROMPT as a separate message instead.
+    """
+    context_section = CHARACTER_CONTEXT_PROMPT if include_context else ""
     language_instruction = ""
     if language == "auto":
         # Automatic language detection - let the AI detect and respond in user's language
@@ -162,21 +188,7 @@ You are the virtual assistant for {{restaurant_name}}. You help customers with:
 4. Handling dietary restrictions and special requests
 5. Providing order status updates
 
-# Restaurant Information
-
-{{restaurant_info}}
-
-## Customer Background
-
-Here's what you know about this customer from previous conversations:
-
-{{memory_context}}
-
-## Current Status
-
-{{current_activity}}
-
-# Personality & Communication Style
+{context_section}# Personality & Communication Style
 
 - Be friendly, helpful, and enthusiastic about the food
 - Use casual, conversational language like you're texting a friend
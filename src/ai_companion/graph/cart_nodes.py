@@ -1,6 +1,9 @@
 """Graph nodes for shopping cart operations."""
 import logging
-from typing import Dict, Optional
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Hashable, Optional, Tuple
 from langchain_core.messages import AIMessage
 from ai_companion.graph.state import AICompanionState
 from ai_companion.modules.cart import (
@@ -17,24 +20,111 @@ from ai_companion.interfaces.whatsapp.interactive_components_v2 import (
     create_size_selection_buttons,
     create_extras_list,
     create_modifiers_list,
-    create_category_selection_list,
 )
-# Legacy components (will be migrated to v2)
+# Legacy components (will be migrated to v2). Components only needed by the
+# checkout/order steps are imported inside the nodes that use them.
 from ai_companion.interfaces.whatsapp.interactive_components import (
     create_item_added_buttons,
     create_cart_view_buttons,
-    create_delivery_method_buttons,
-    create_payment_method_list,
-    create_order_details_message,
-    create_order_status_message,
-    create_menu_list_from_restaurant_menu,
 )
-from ai_companion.core.schedules import RESTAURANT_MENU, RESTAURANT_INFO
+from ai_companion.core.schedules import RESTAURANT_INFO
 # AI-powered message generation
-from ai_companion.graph.utils.message_generator import generate_dynamic_message
+from ai_companion.graph.utils.message_generator import (
+    _get_fallback_message,
+    generate_dynamic_message,
+    generate_llm_message,
+)
 
 logger = logging.getLogger(__name__)
 
+# Memoized cart renderings, keyed on cart contents. Users typically tap
+# "view cart" several times before checking out, so identical carts reuse
+# the rendered summary, buttons and checkout message instead of rebuilding
+# them (or, for the checkout message, calling the LLM again).
+_CART_RENDER_CACHE_SIZE = 256
+_cart_summary_cache: "OrderedDict[Hashable, Tuple[str, Dict]]" = OrderedDict()
+_checkout_message_cache: "OrderedDict[Hashable, str]" = OrderedDict()
+
+
+# Static replies, validated once at import. Nodes return a shallow copy via
+# _static_reply(): add_messages assigns an id to every returned message, so
+# the shared instances themselves must never be handed to the graph.
+_MSG_CART_CLEARED = AIMessage(content="🗑️ Cart cleared! Ready to start a new order?")
+_MSG_ORDER_SUMMARY = AIMessage(content="Here's your order summary:")
+_MSG_LOCATION_REQUEST = AIMessage(content="location_request")
+_MSG_PICKUP_SELECTED = AIMessage(content=f"Great! You can pick up from {RESTAURANT_INFO['address']}")
+_MSG_DINE_IN_SELECTED = AIMessage(content="Wonderful! We'll have your table ready.")
+
+
+def _static_reply(message: AIMessage) -> AIMessage:
+    """Return a fresh copy of a prebuilt message without re-running validation."""
+    return message.model_copy()
+
+
+def _lowercase(text: str) -> str:
+    """Lowercase a reply, reusing the original string when it already is."""
+    return text if text.islower() else text.lower()
+
+
+# Text fallback for delivery method parsing. "pick" also covers "pickup" and
+# "dine" covers "dine-in"; matches are ranked pickup > dine-in > delivery.
+_DELIVERY_METHOD_TEXT_RE = re.compile(r"pick|dine|delivery")
+
+# Keyword buckets for free-text size and payment replies, each scanned in a
+# single pass. re.IGNORECASE replaces lowercasing the message first.
+_SIZE_TEXT_RE = re.compile(r"small|medium|large", re.IGNORECASE)
+_PAYMENT_TEXT_RE = re.compile(
+    r"(?P<credit>credit)|(?P<debit>debit)|(?P<mobile>mobile|apple|google)", re.IGNORECASE
+)
+# Payment methods by named group, in priority order
+_PAYMENT_TEXT_METHODS = (
+    ("credit", PaymentMethod.CREDIT_CARD.value),
+    ("debit", PaymentMethod.DEBIT_CARD.value),
+    ("mobile", PaymentMethod.MOBILE_PAYMENT.value),
+)
+
+# Legacy extras as (extra id, phrase matched in the lowercased reply)
+_EXTRA_TEXT_OPTIONS = tuple(
+    (extra, extra.replace("_", " "))
+    for extra in ("extra_cheese", "mushrooms", "olives", "pepperoni", "bacon", "chicken")
+)
+_EXTRA_BY_PHRASE = {phrase: extra for extra, phrase in _EXTRA_TEXT_OPTIONS}
+# One scan reports every phrase; the lookahead keeps overlapping hits
+_EXTRA_TEXT_RE = re.compile(
+    "(?=(" + "|".join(re.escape(phrase) for _, phrase in _EXTRA_TEXT_OPTIONS) + "))"
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_extras_text(message_lower: str) -> Tuple[str, ...]:
+    """Return the legacy extras mentioned in an already lowercased reply."""
+    found = {_EXTRA_BY_PHRASE[phrase] for phrase in _EXTRA_TEXT_RE.findall(message_lower)}
+    if not found:
+        return ()
+    # Keep the menu order regardless of where each extra appears in the text
+    return tuple(extra for extra, _ in _EXTRA_TEXT_OPTIONS if extra in found)
+
+
+def _cart_fingerprint(cart: ShoppingCart) -> Tuple:
+    """Build a hashable fingerprint of the cart contents."""
+    return tuple((item.id, item.quantity, round(item.item_total, 2)) for item in cart.items)
+
+
+def _cache_get(cache: OrderedDict, key: Hashable):
+    """Return a cached value and mark it as recently used, or None on miss."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: Hashable, value) -> None:
+    """Store a value, evicting the least recently used entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _CART_RENDER_CACHE_SIZE:
+        cache.popitem(last=False)
+
 
 def get_or_create_cart(state: AICompanionState) -> ShoppingCart:
     """Get existing cart from state or create new one."""
@@ -156,14 +246,13 @@ async def handle_size_selection_node(state: AICompanionState) -> Dict:
     category = current_item.get("category", "")
 
     # Extract size from last message (e.g., "size_medium")
-    last_message = state["messages"][-1].content.lower()
+    last_message = state["messages"][-1].content
+    sizes = {match.lower() for match in _SIZE_TEXT_RE.findall(last_message)}
     size = None
-    if "small" in last_message:
-        size = "small"
-    elif "medium" in last_message:
-        size = "medium"
-    elif "large" in last_message:
-        size = "large"
+    for candidate in ("small", "medium", "large"):
+        if candidate in sizes:
+            size = candidate
+            break
 
     if not size:
         size = "medium"  # Default
@@ -209,18 +298,16 @@ async def handle_size_selection_node(state: AICompanionState) -> Dict:
 async def handle_extras_selection_node(state: AICompanionState) -> Dict:
     """Handle extras/toppings selection."""
     # Extract extras from last message
-    last_message = state["messages"][-1].content.lower()
+    last_message = _lowercase(state["messages"][-1].content)
 
     pending = state.get("pending_customization") or {}
     extras = pending.get("extras", [])
 
     # Parse extra selection (would come from interactive list reply)
     # For now, we'll extract from the message content
-    extra_options = ["extra_cheese", "mushrooms", "olives", "pepperoni", "bacon", "chicken"]
-    for extra in extra_options:
-        if extra.replace("_", " ") in last_message:
-            if extra not in extras:
-                extras.append(extra)
+    for extra in _parse_extras_text(last_message):
+        if extra not in extras:
+            extras.append(extra)
 
     pending["extras"] = extras
 
@@ -297,11 +384,18 @@ async def view_cart_node(state: AICompanionState) -> Dict:
             "order_stage": OrderStage.BROWSING.value
         }
 
-    # Generate cart summary
-    summary = cart_service.get_cart_summary(cart)
+    # Reuse the rendered summary and buttons if the cart hasn't changed
+    fingerprint = _cart_fingerprint(cart)
+    cached = _cache_get(_cart_summary_cache, fingerprint)
+    if cached is not None:
+        summary, interactive_comp = cached
+    else:
+        # Generate cart summary
+        summary = cart_service.get_cart_summary(cart)
 
-    # Create action buttons
-    interactive_comp = create_cart_view_buttons(cart.subtotal, cart.item_count)
+        # Create action buttons
+        interactive_comp = create_cart_view_buttons(cart.subtotal, cart.item_count)
+        _cache_put(_cart_summary_cache, fingerprint, (summary, interactive_comp))
 
     return {
         "messages": AIMessage(content=summary),
@@ -316,7 +410,7 @@ async def clear_cart_node(state: AICompanionState) -> Dict:
     cart.clear()
 
     return {
-        "messages": AIMessage(content="🗑️ Cart cleared! Ready to start a new order?"),
+        "messages": _static_reply(_MSG_CART_CLEARED),
         "shopping_cart": cart.to_dict(),
         "order_stage": OrderStage.BROWSING.value,
         "use_interactive_menu": True
@@ -325,6 +419,10 @@ async def clear_cart_node(state: AICompanionState) -> Dict:
 
 async def checkout_node(state: AICompanionState) -> Dict:
     """Begin checkout process."""
+    from ai_companion.interfaces.whatsapp.interactive_components import (
+        create_delivery_method_buttons,
+    )
+
     cart = get_or_create_cart(state)
 
     if cart.is_empty:
@@ -339,14 +437,21 @@ async def checkout_node(state: AICompanionState) -> Dict:
     # Ask for delivery method
     interactive_comp = create_delivery_method_buttons()
 
-    # Generate AI-powered checkout start message
-    message = await generate_dynamic_message(
-        "checkout_start",
-        {
-            "item_count": cart.item_count,
-            "total": cart.subtotal
-        }
-    )
+    # Generate AI-powered checkout start message (once per cart state)
+    item_count = cart.item_count
+    subtotal = cart.subtotal
+    checkout_key = (item_count, round(subtotal * 100))
+    message = _cache_get(_checkout_message_cache, checkout_key)
+    if message is None:
+        context = {"item_count": item_count, "total": subtotal}
+        try:
+            message = await generate_llm_message("checkout_start", context)
+        except Exception as e:
+            # The fallback is served but not cached, so the next checkout retries
+            logger.error(f"Error generating checkout message: {e}", exc_info=True)
+            message = _get_fallback_message("checkout_start", context)
+        else:
+            _cache_put(_checkout_message_cache, checkout_key, message)
 
     return {
         "messages": AIMessage(content=message),
@@ -357,6 +462,10 @@ async def checkout_node(state: AICompanionState) -> Dict:
 
 async def handle_delivery_method_node(state: AICompanionState) -> Dict:
     """Handle delivery method selection."""
+    from ai_companion.interfaces.whatsapp.interactive_components import (
+        create_payment_method_list,
+    )
+
     # Check if we have the button ID from the interactive component
     selected_delivery_method = state.get("selected_delivery_method")
 
@@ -372,11 +481,11 @@ async def handle_delivery_method_node(state: AICompanionState) -> Dict:
 
         elif selected_delivery_method == "pickup":
             delivery_method = DeliveryMethod.PICKUP.value
-            next_message = f"Great! You can pick up from {RESTAURANT_INFO['address']}"
+            next_message = _MSG_PICKUP_SELECTED
 
         elif selected_delivery_method == "dine_in":
             delivery_method = DeliveryMethod.DINE_IN.value
-            next_message = "Wonderful! We'll have your table ready."
+            next_message = _MSG_DINE_IN_SELECTED
 
         else:
             # Unknown button ID, default to delivery
@@ -386,16 +495,19 @@ async def handle_delivery_method_node(state: AICompanionState) -> Dict:
 
     else:
         # Fallback: parse from text message (for backward compatibility or text input)
-        last_message = state["messages"][-1].content.lower()
+        last_message = _lowercase(state["messages"][-1].content)
         logger.info(f"Delivery method from text parsing: {last_message}")
 
-        if "pickup" in last_message or "pick" in last_message:
+        # Single scan over the message, then pick the highest-priority keyword
+        keywords = set(_DELIVERY_METHOD_TEXT_RE.findall(last_message))
+
+        if "pick" in keywords:
             delivery_method = DeliveryMethod.PICKUP.value
-            next_message = f"Great! You can pick up from {RESTAURANT_INFO['address']}"
-        elif "dine" in last_message or "dine-in" in last_message:
+            next_message = _MSG_PICKUP_SELECTED
+        elif "dine" in keywords:
             delivery_method = DeliveryMethod.DINE_IN.value
-            next_message = "Wonderful! We'll have your table ready."
-        elif "delivery" in last_message:
+            next_message = _MSG_DINE_IN_SELECTED
+        elif "delivery" in keywords:
             delivery_method = DeliveryMethod.DELIVERY.value
             logger.info("Delivery selected, requesting fresh location for this order")
             return await request_delivery_location_node(state)
@@ -409,7 +521,7 @@ async def handle_delivery_method_node(state: AICompanionState) -> Dict:
     interactive_comp = create_payment_method_list()
 
     return {
-        "messages": AIMessage(content=next_message),
+        "messages": _static_reply(next_message),
         "interactive_component": interactive_comp,
         "delivery_method": delivery_method,
         "user_phone": state.get("user_phone"),  # Persist user_phone through the flow
@@ -419,19 +531,22 @@ async def handle_delivery_method_node(state: AICompanionState) -> Dict:
 
 async def handle_payment_method_node(state: AICompanionState) -> Dict:
     """Handle payment method selection and show order details."""
+    from ai_companion.interfaces.whatsapp.interactive_components import (
+        create_order_details_message,
+    )
+
     cart_service = CartService()
     cart = get_or_create_cart(state)
 
-    last_message = state["messages"][-1].content.lower()
+    last_message = state["messages"][-1].content
 
     # Parse payment method
     payment_method = PaymentMethod.CASH.value
-    if "credit" in last_message:
-        payment_method = PaymentMethod.CREDIT_CARD.value
-    elif "debit" in last_message:
-        payment_method = PaymentMethod.DEBIT_CARD.value
-    elif "mobile" in last_message or "apple" in last_message or "google" in last_message:
-        payment_method = PaymentMethod.MOBILE_PAYMENT.value
+    found = {match.lastgroup for match in _PAYMENT_TEXT_RE.finditer(last_message)}
+    for group, method in _PAYMENT_TEXT_METHODS:
+        if group in found:
+            payment_method = method
+            break
 
     # Create order preview from cart
     delivery_method_str = state.get("delivery_method", DeliveryMethod.DELIVERY.value)
@@ -479,7 +594,7 @@ async def handle_payment_method_node(state: AICompanionState) -> Dict:
     interactive_comp = create_order_details_message(order_dict)
 
     return {
-        "messages": AIMessage(content=f"Here's your order summary:"),
+        "messages": _static_reply(_MSG_ORDER_SUMMARY),
         "interactive_component": interactive_comp,
         "payment_method": payment_method,
         "customer_phone": customer_phone,  # Persist customer_phone to state
@@ -490,6 +605,9 @@ async def handle_payment_method_node(state: AICompanionState) -> Dict:
 
 async def confirm_order_node(state: AICompanionState) -> Dict:
     """Confirm and finalize the order."""
+    from ai_companion.interfaces.whatsapp.interactive_components import (
+        create_order_status_message,
+    )
     from ai_companion.modules.cart.order_messages import format_order_confirmation_async
 
     cart_service = CartService()
@@ -566,7 +684,7 @@ async def request_delivery_location_node(state: AICompanionState) -> Dict:
     )
 
     return {
-        "messages": AIMessage(content="location_request"),
+        "messages": _static_reply(_MSG_LOCATION_REQUEST),
         "interactive_component": interactive_comp,
         "awaiting_location": True,
         "order_stage": OrderStage.AWAITING_LOCATION.value
@@ -16,22 +16,16 @@ def should_summarize_conversation(
     return END
 
 
+# Router workflow -> response node; anything else is handled as conversation
+_WORKFLOW_NODES = {
+    "order": "order_node",
+    "menu": "menu_node",
+    "image": "image_node",
+    "audio": "audio_node",
+}
+
+
 def select_workflow(
     state: AICompanionState,
 ) -> Literal["conversation_node", "order_node", "menu_node", "image_node", "audio_node"]:
-    workflow = state["workflow"]
-
-    if workflow == "order":
-        return "order_node"
-
-    elif workflow == "menu":
-        return "menu_node"
-
-    elif workflow == "image":
-        return "image_node"
-
-    elif workflow == "audio":
-        return "audio_node"
-
-    else:
-        return "conversation_node"
+    return _WORKFLOW_NODES.get(state["workflow"], "conversation_node")
@@ -41,15 +41,16 @@ def create_workflow_graph():
     # First extract memories from customer message
     graph_builder.add_edge(START, "memory_extraction_node")
 
-    # Then determine response type
+    # Then determine response type while retrieving memories; the two are
+    # independent, so the vector search overlaps the router LLM call
     graph_builder.add_edge("memory_extraction_node", "router_node")
+    graph_builder.add_edge("memory_extraction_node", "memory_injection_node")
 
-    # Then inject both context and memories
-    graph_builder.add_edge("router_node", "context_injection_node")
-    graph_builder.add_edge("context_injection_node", "memory_injection_node")
+    # Once both are done, inject the current context
+    graph_builder.add_edge(["router_node", "memory_injection_node"], "context_injection_node")
 
     # Then proceed to appropriate response node
-    graph_builder.add_conditional_edges("memory_injection_node", select_workflow)
+    graph_builder.add_conditional_edges("context_injection_node", select_workflow)
 
     # Check for summarization after any response
     graph_builder.add_conditional_edges("conversation_node", should_summarize_conversation)
@@ -1,4 +1,11 @@
+import asyncio
+import hashlib
+import logging
 import os
+import re
+from functools import lru_cache, partial
+from typing import Awaitable, Callable, Optional
+from itertools import islice
 from uuid import uuid4
 
 from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
@@ -7,24 +14,54 @@ from langchain_core.runnables import RunnableConfig
 from ai_companion.graph.state import AICompanionState
 from ai_companion.graph.utils.chains import (
     get_character_response_chain,
+    get_character_response_stream_chain,
     get_router_chain,
     get_order_processing_chain,
-    get_menu_display_chain,
 )
 from ai_companion.graph.utils.helpers import (
     get_chat_model,
+    remove_asterisk_content,
     get_text_to_image_module,
     get_text_to_speech_module,
 )
+from ai_companion.graph.utils.semantic_cache import get_semantic_cache
 from ai_companion.modules.memory.long_term.memory_manager import get_memory_manager
-from ai_companion.modules.schedules.context_generation import ScheduleContextGenerator
+from ai_companion.modules.schedules.context_generation import _WEEKDAY_NAMES, ScheduleContextGenerator
 from ai_companion.settings import settings
-from ai_companion.core.schedules import RESTAURANT_MENU, BUSINESS_HOURS, RESTAURANT_INFO, SPECIAL_OFFERS
+from ai_companion.core.schedules import RESTAURANT_MENU, SPECIAL_OFFERS
 import json
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
+# Messages the webhook generates itself when it hands a turn to the graph.
+# Their workflow is already known, so they skip the router LLM call.
+_LOCATION_MESSAGE_PREFIX = "[User shared location:"
+
+
+@lru_cache(maxsize=1)
+def _deterministic_routes() -> dict:
+    """Map interaction phrases for conversation-bound buttons to their workflow."""
+    # Imported lazily: the WhatsApp interface imports the graph package
+    from ai_companion.interfaces.whatsapp.cart_handler import CartInteractionHandler
+
+    return {
+        CartInteractionHandler.INTERACTION_PHRASES[interaction_id]: "conversation"
+        for interaction_id, (node_name, _) in CartInteractionHandler.EXACT_ACTIONS.items()
+        if node_name == "conversation" and interaction_id in CartInteractionHandler.INTERACTION_PHRASES
+    }
+
 
 async def router_node(state: AICompanionState):
+    last_message = state["messages"][-1].content
+    if isinstance(last_message, str):
+        if last_message.startswith(_LOCATION_MESSAGE_PREFIX):
+            return {"workflow": "conversation"}
+        workflow = _deterministic_routes().get(last_message)
+        if workflow is not None:
+            return {"workflow": workflow}
+
     chain = get_router_chain()
     response = await chain.ainvoke({"messages": state["messages"][-settings.ROUTER_MESSAGES_TO_ANALYZE :]})
     return {"workflow": response.response_type}
@@ -40,92 +77,238 @@ def context_injection_node(state: AICompanionState):
 
 
 async def conversation_node(state: AICompanionState, config: RunnableConfig):
-    current_activity = ScheduleContextGenerator.get_current_activity()
+    # Computed for this turn by context_injection_node
+    current_activity = state.get("current_activity") or ScheduleContextGenerator.get_current_activity()
     memory_context = state.get("memory_context", "")
 
-    # Format restaurant info for injection
-    restaurant_info = f"{RESTAURANT_INFO['name']}\n"
-    restaurant_info += f"Address: {RESTAURANT_INFO['address']}\nPhone: {RESTAURANT_INFO['phone']}"
+    chain = get_character_response_chain(bool(state.get("summary")))
+    payload = _character_payload(
+        state, state["messages"][-settings.CONVERSATION_MESSAGES_WINDOW :], current_activity, memory_context
+    )
+
+    response = await _cached_reply(state, chain, payload, config, "conversation", current_activity, memory_context)
+    return {"messages": AIMessage(content=response)}
+
+
+def _character_payload(
+    state: AICompanionState, messages: list, current_activity: str, memory_context: str
+) -> dict:
+    """Build the input of the character response chain for this turn."""
+    payload = {
+        "messages": messages,
+        "restaurant_info": current_activity,
+        "memory_context": memory_context or "No previous information about this customer.",
+        "current_activity": current_activity,
+    }
+    if state.get("summary"):
+        payload["summary"] = state["summary"]
+    return payload
+
+
+async def _cached_reply(
+    state: AICompanionState,
+    chain,
+    payload: dict,
+    config: RunnableConfig,
+    node: str,
+    current_activity: str,
+    memory_context: str,
+    generate: Optional[Callable[[], Awaitable[str]]] = None,
+) -> str:
+    """Invoke a reply chain, answering paraphrased repeats from the semantic cache.
+
+    The scope pins everything besides the customer's message that shapes the
+    reply: the node, every earlier message the chain sees, the summary,
+    memories and the current activity. Identical requests in flight at the
+    same time share one chain call. ``generate`` replaces the plain
+    ``chain.ainvoke`` call when a reply has to be produced.
+
+    Earlier messages are matched on role and content rather than message ids:
+    ids are unique per thread, so requiring them would confine hits to one
+    conversation. Caching stays on at the chat model's non-zero temperature;
+    a hit reuses one sampled reply for a paraphrase in an identical context.
+    """
+    if generate is None:
+        generate = partial(chain.ainvoke, payload, config)
+
+    user_message = state["messages"][-1].content
+    cache = get_semantic_cache()
+    # Only flags describing this turn count here: use_interactive_menu and
+    # interactive_component stay set in the checkpoint after the flow that set
+    # them, and the reply depends only on the payload the scope already pins
+    if not cache.is_cacheable(user_message) or state.get("awaiting_location"):
+        return await generate()
+
+    history = _history_digest(payload["messages"][:-1])
+    scope = (node, history, state.get("summary", ""), memory_context, current_activity)
+    return await cache.get_or_generate(user_message, scope, generate)
+
+
+def _history_digest(messages: list) -> str:
+    """Digest the role and content of each message, in order."""
+    digest = hashlib.sha256()
+    for message in messages:
+        digest.update(f"{message.type}\0{message.content}\0".encode())
+    return digest.hexdigest()
+
+
+# A speech chunk ends at sentence punctuation followed by whitespace. Chunks
+# shorter than the minimum are merged with the next so short sentences don't
+# each cost a TTS request.
+_SENTENCE_BREAK_RE = re.compile(r"[.!?…]\s")
+_MIN_SPEECH_CHUNK_CHARS = 100
+
+
+class _SpeechSynthesis:
+    """Speech synthesis of one reply, one concurrent request per chunk.
+
+    Each chunk is sent with the text spoken before it, so ElevenLabs keeps
+    the voice's prosody continuous when the clips are joined.
+    """
+
+    def __init__(self, text_to_speech_module):
+        self._text_to_speech = text_to_speech_module
+        self._spoken: list = []
+        self._cancelled = False
+        self.tasks: list = []
+
+    def speak(self, text: str) -> None:
+        """Start synthesizing the next chunk of the reply."""
+        text = remove_asterisk_content(text)
+        if not text or self._cancelled:
+            return
+        previous_text = " ".join(self._spoken) or None
+        self._spoken.append(text)
+        self.tasks.append(
+            asyncio.create_task(self._text_to_speech.synthesize(text, previous_text=previous_text))
+        )
 
-    # Create modified messages with injected restaurant info
-    system_prompt = get_character_response_chain(state.get("summary", ""))
+    async def audio(self) -> bytes:
+        """Wait for every chunk and join the clips in reply order."""
+        return b"".join(await asyncio.gather(*self.tasks))
 
-    # Manually format the system message with all variables
-    from ai_companion.core.prompts import get_character_card_prompt
-    system_message = get_character_card_prompt(settings.LANGUAGE)
-    if state.get("summary", ""):
-        system_message += f"\n\nSummary of conversation earlier with the customer: {state.get('summary', '')}"
+    def cancel(self) -> None:
+        """Cancel running synthesis and ignore chunks that arrive later."""
+        self._cancelled = True
+        for task in self.tasks:
+            task.cancel()
 
-    # Replace placeholders
-    system_message = system_message.replace("{restaurant_name}", RESTAURANT_INFO['name'])
-    system_message = system_message.replace("{restaurant_info}", current_activity)
-    system_message = system_message.replace("{memory_context}", memory_context if memory_context else "No previous information about this customer.")
-    system_message = system_message.replace("{current_activity}", current_activity)
 
-    # Use the chain directly with the formatted prompt
-    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-    from ai_companion.graph.utils.helpers import AsteriskRemovalParser, get_chat_model
+async def _stream_reply_with_speech(
+    chain, payload: dict, config: RunnableConfig, speech: _SpeechSynthesis
+) -> str:
+    """Stream a reply, starting speech synthesis for each chunk as it completes.
 
-    model = get_chat_model()
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", system_message),
-        MessagesPlaceholder(variable_name="messages"),
-    ])
-    chain = prompt | model | AsteriskRemovalParser()
+    Returns the full reply with stage directions removed.
+    """
+    raw_chunks = []
+    pending = ""
 
-    response = await chain.ainvoke({"messages": state["messages"]}, config)
-    return {"messages": AIMessage(content=response)}
+    async for chunk in chain.astream(payload, config):
+        raw_chunks.append(chunk)
+        pending += chunk
+        if len(pending) < _MIN_SPEECH_CHUNK_CHARS:
+            continue
+        # Cut at the last sentence break outside a *stage direction*
+        cut = 0
+        for match in _SENTENCE_BREAK_RE.finditer(pending):
+            if pending.count("*", 0, match.end()) % 2 == 0:
+                cut = match.end()
+        if cut >= _MIN_SPEECH_CHUNK_CHARS:
+            speech.speak(pending[:cut])
+            pending = pending[cut:]
+    speech.speak(pending)
+
+    return remove_asterisk_content("".join(raw_chunks))
+
+
+_IMAGES_DIR = "generated_images"
+
+
+@lru_cache(maxsize=1)
+def _images_dir() -> str:
+    """Create the generated images directory on first use only."""
+    os.makedirs(_IMAGES_DIR, exist_ok=True)
+    return _IMAGES_DIR
 
 
 async def image_node(state: AICompanionState, config: RunnableConfig):
-    current_activity = ScheduleContextGenerator.get_current_activity()
+    # Computed for this turn by context_injection_node
+    current_activity = state.get("current_activity") or ScheduleContextGenerator.get_current_activity()
     memory_context = state.get("memory_context", "")
 
-    chain = get_character_response_chain(state.get("summary", ""))
+    chain = get_character_response_chain(bool(state.get("summary")))
     text_to_image_module = get_text_to_image_module()
 
     scenario = await text_to_image_module.create_scenario(state["messages"][-5:])
-    os.makedirs("generated_images", exist_ok=True)
-    img_path = f"generated_images/image_{str(uuid4())}.png"
-    await text_to_image_module.generate_image(scenario.image_prompt, img_path)
+    img_path = f"{_images_dir()}/image_{uuid4().hex}.png"
 
     # Inject the image prompt information as an AI message
     scenario_message = AIMessage(content=f"<image attached by Ava generated from prompt: {scenario.image_prompt}>")
-    updated_messages = state["messages"] + [scenario_message]
-
-    response = await chain.ainvoke(
-        {
-            "messages": updated_messages,
-            "current_activity": current_activity,
-            "memory_context": memory_context,
-        },
-        config,
+    updated_messages = [*state["messages"][-settings.CONVERSATION_MESSAGES_WINDOW :], scenario_message]
+
+    # The reply only needs the scenario, not the rendered image, so generate
+    # both concurrently
+    _, response = await asyncio.gather(
+        text_to_image_module.generate_image(scenario.image_prompt, img_path),
+        chain.ainvoke(_character_payload(state, updated_messages, current_activity, memory_context), config),
     )
 
     return {"messages": AIMessage(content=response), "image_path": img_path}
 
 
 async def audio_node(state: AICompanionState, config: RunnableConfig):
-    current_activity = ScheduleContextGenerator.get_current_activity()
+    # Computed for this turn by context_injection_node
+    current_activity = state.get("current_activity") or ScheduleContextGenerator.get_current_activity()
     memory_context = state.get("memory_context", "")
 
-    chain = get_character_response_chain(state.get("summary", ""))
+    has_summary = bool(state.get("summary"))
+    chain = get_character_response_chain(has_summary)
     text_to_speech_module = get_text_to_speech_module()
-
-    response = await chain.ainvoke(
-        {
-            "messages": state["messages"],
-            "current_activity": current_activity,
-            "memory_context": memory_context,
-        },
-        config,
+    payload = _character_payload(
+        state, state["messages"][-settings.CONVERSATION_MESSAGES_WINDOW :], current_activity, memory_context
     )
-    output_audio = await text_to_speech_module.synthesize(response)
+
+    # When the reply is generated here, it is streamed so synthesis of the
+    # first sentences overlaps with generation of the rest
+    speech = _SpeechSynthesis(text_to_speech_module)
+    try:
+        response = await _cached_reply(
+            state,
+            chain,
+            payload,
+            config,
+            "audio",
+            current_activity,
+            memory_context,
+            generate=partial(
+                _stream_reply_with_speech,
+                get_character_response_stream_chain(has_summary),
+                payload,
+                config,
+                speech,
+            ),
+        )
+        if speech.tasks:
+            output_audio = await speech.audio()
+        else:
+            # Cached or shared reply, or nothing was generated here
+            output_audio = await text_to_speech_module.synthesize(response)
+    except BaseException:
+        # The cache shields generation from our cancellation, so synthesis
+        # has to be stopped from here
+        speech.cancel()
+        raise
 
     return {"messages": response, "audio_buffer": output_audio}
 
 
 async def summarize_conversation_node(state: AICompanionState):
+    # Nothing would be trimmed, so skip the summarization call entirely
+    messages_to_remove = len(state["messages"]) - settings.TOTAL_MESSAGES_AFTER_SUMMARY
+    if messages_to_remove <= 0:
+        return {}
+
     model = get_chat_model()
     summary = state.get("summary", "")
 
@@ -141,30 +324,63 @@ async def summarize_conversation_node(state: AICompanionState):
             "but that captures all the relevant information shared between Ava and the user:"
         )
 
-    messages = state["messages"] + [HumanMessage(content=summary_message)]
-    response = await model.ainvoke(messages)
+    # Only the messages being pruned are folded into the summary. The kept tail
+    # stays in context as-is and is summarized when it is pruned in a later
+    # round, so no message is sent to the summarizer twice.
+    pruned = list(islice(state["messages"], messages_to_remove))
+    response = await model.ainvoke([*pruned, HumanMessage(content=summary_message)])
 
-    delete_messages = [RemoveMessage(id=m.id) for m in state["messages"][: -settings.TOTAL_MESSAGES_AFTER_SUMMARY]]
+    delete_messages = [RemoveMessage(id=m.id) for m in pruned]
     return {"summary": response.content, "messages": delete_messages}
 
 
+# Memory extraction runs off the response path. Strong references keep pending
+# tasks from being garbage-collected before they finish.
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    _BACKGROUND_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background memory extraction failed", exc_info=task.exception())
+
+
+async def drain_background_tasks() -> None:
+    """Wait for pending background memory extraction; call on shutdown."""
+    if _BACKGROUND_TASKS:
+        await asyncio.gather(*_BACKGROUND_TASKS, return_exceptions=True)
+
+
 async def memory_extraction_node(state: AICompanionState):
-    """Extract and store important information from the last message."""
+    """Extract and store important information from the last message.
+
+    Extracted memories are only needed on later turns, so the analysis is
+    scheduled in the background instead of delaying this turn's reply.
+    """
     if not state["messages"]:
         return {}
 
     memory_manager = get_memory_manager()
-    await memory_manager.extract_and_store_memories(state["messages"][-1])
+    last_message = state["messages"][-1]
+    # Most turns in a button-driven flow are trivial; don't schedule those
+    if not memory_manager.is_memory_candidate(last_message):
+        return {}
+
+    task = asyncio.create_task(memory_manager.extract_and_store_memories(last_message))
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_on_background_task_done)
     return {}
 
 
-def memory_injection_node(state: AICompanionState):
+async def memory_injection_node(state: AICompanionState):
     """Retrieve and inject relevant memories into the character card."""
     memory_manager = get_memory_manager()
 
-    # Get relevant memories based on recent conversation
-    recent_context = " ".join([m.content for m in state["messages"][-3:]])
-    memories = memory_manager.get_relevant_memories(recent_context)
+    # Get relevant memories based on recent conversation. The lookup is async
+    # (batched embedding, threaded vector search), so the router call proceeds
+    # meanwhile
+    recent_context = " ".join(m.content for m in state["messages"][-3:])
+    memories = await memory_manager.aget_relevant_memories(recent_context)
 
     # Format memories for the character card
     memory_context = memory_manager.format_memories_for_prompt(memories)
@@ -172,24 +388,26 @@ def memory_injection_node(state: AICompanionState):
     return {"memory_context": memory_context}
 
 
+# The menu is static, so it is serialized once instead of on every order turn.
+# The message is only read by the chain, never added to graph state.
+_MENU_DATA_JSON = json.dumps(RESTAURANT_MENU, indent=2)
+_MENU_DATA_MESSAGE = HumanMessage(content=f"Restaurant Menu:\n{_MENU_DATA_JSON}\n\nTax Rate: {settings.TAX_RATE}")
+
+
 async def order_node(state: AICompanionState, config: RunnableConfig):
     """Process customer order and calculate total."""
     memory_context = state.get("memory_context", "")
 
-    # Format menu data for the chain
-    menu_data = json.dumps(RESTAURANT_MENU, indent=2)
-
     chain = get_order_processing_chain()
 
     try:
         # Add menu data to messages
-        system_msg = HumanMessage(content=f"Restaurant Menu:\n{menu_data}\n\nTax Rate: {settings.TAX_RATE}")
-        messages_with_menu = state["messages"] + [system_msg]
+        messages_with_menu = state["messages"] + [_MENU_DATA_MESSAGE]
 
         response = await chain.ainvoke(
             {
                 "messages": messages_with_menu,
-                "menu_data": menu_data,
+                "menu_data": _MENU_DATA_JSON,
             },
             config
         )
@@ -204,20 +422,19 @@ async def order_node(state: AICompanionState, config: RunnableConfig):
         return {"messages": AIMessage(content=fallback_msg)}
 
 
+@lru_cache(maxsize=len(_WEEKDAY_NAMES))
+def _menu_message_for(weekday: int) -> str:
+    """Build the menu intro with the day's special, once per weekday."""
+    special = SPECIAL_OFFERS["daily_specials"].get(_WEEKDAY_NAMES[weekday])
+    special_text = f"\n\n✨ Today's Special: {special}" if special is not None else ""
+    return f"Here's our menu!{special_text}"
+
+
 async def menu_node(state: AICompanionState, config: RunnableConfig):
     """Display menu items to the customer using interactive list."""
     # Store flag to send interactive menu
     # The response will be handled in the webhook with interactive components
-
-    # Add today's special to the message
-    today = datetime.now().strftime("%A").lower()
-    special_text = ""
-    if today in SPECIAL_OFFERS["daily_specials"]:
-        special_text = f"\n\n✨ Today's Special: {SPECIAL_OFFERS['daily_specials'][today]}"
-
-    menu_message = f"Here's our menu!{special_text}"
-
     return {
-        "messages": AIMessage(content=menu_message),
+        "messages": AIMessage(content=_menu_message_for(datetime.now().weekday())),
         "use_interactive_menu": True  # Flag to trigger interactive component
     }
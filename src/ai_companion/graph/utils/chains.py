@@ -1,8 +1,18 @@
+from functools import lru_cache
+
+from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
-from ai_companion.core.prompts import get_character_card_prompt, ROUTER_PROMPT, ORDER_PROCESSING_PROMPT, MENU_DISPLAY_PROMPT
+from ai_companion.core.prompts import (
+    CHARACTER_CONTEXT_PROMPT,
+    get_character_card_prompt,
+    ROUTER_PROMPT,
+    ORDER_PROCESSING_PROMPT,
+    MENU_DISPLAY_PROMPT,
+)
+from ai_companion.core.schedules import RESTAURANT_INFO
 from ai_companion.graph.utils.helpers import AsteriskRemovalParser, get_chat_model
 from ai_companion.settings import settings
 
@@ -27,6 +37,7 @@ class OrderProcessingResponse(BaseModel):
     confirmation_message: str = Field(description="Friendly confirmation message for the customer")
 
 
+@lru_cache(maxsize=1)
 def get_router_chain():
     model = get_chat_model(temperature=0.3).with_structured_output(RouterResponse)
 
@@ -37,23 +48,52 @@ def get_router_chain():
     return prompt | model
 
 
-def get_character_response_chain(summary: str = ""):
-    model = get_chat_model()
-    system_message = get_character_card_prompt(settings.LANGUAGE)
+# Chains are immutable runnables, so they are built once and shared across turns.
+# The character card only depends on the configured language and restaurant, so
+# the restaurant name is substituted up front (braces escaped, since the card is
+# a prompt template). Per-turn context and the summary are template variables in
+# a second system message, which keeps the card an identical, cacheable prefix.
+@lru_cache(maxsize=2)
+def _get_character_prompt(has_summary: bool) -> ChatPromptTemplate:
+    character_card = get_character_card_prompt(settings.LANGUAGE, include_context=False).replace(
+        "{restaurant_name}", RESTAURANT_INFO["name"].replace("{", "{{").replace("}", "}}")
+    )
 
-    if summary:
-        system_message += f"\n\nSummary of conversation earlier with the customer: {summary}"
+    context_message = CHARACTER_CONTEXT_PROMPT.rstrip()
+    if has_summary:
+        context_message += "\n\nSummary of conversation earlier with the customer: {summary}"
 
-    prompt = ChatPromptTemplate.from_messages(
+    return ChatPromptTemplate.from_messages(
         [
-            ("system", system_message),
+            ("system", character_card),
+            ("system", context_message),
             MessagesPlaceholder(variable_name="messages"),
         ]
     )
 
-    return prompt | model | AsteriskRemovalParser()
+
+@lru_cache(maxsize=2)
+def get_character_response_chain(has_summary: bool = False):
+    """Get the character reply chain.
+
+    Expects ``messages``, ``restaurant_info``, ``memory_context`` and
+    ``current_activity`` (plus ``summary`` when ``has_summary``) as input.
+    """
+    return _get_character_prompt(has_summary) | get_chat_model() | AsteriskRemovalParser()
+
+
+@lru_cache(maxsize=2)
+def get_character_response_stream_chain(has_summary: bool = False):
+    """Get the character reply chain for streaming, with raw text chunks.
+
+    Stage directions can span chunks, so callers strip them from the
+    assembled text (see ``remove_asterisk_content``). Takes the same input as
+    ``get_character_response_chain``.
+    """
+    return _get_character_prompt(has_summary) | get_chat_model() | StrOutputParser()
 
 
+@lru_cache(maxsize=1)
 def get_order_processing_chain():
     """Get chain for processing customer orders."""
     model = get_chat_model(temperature=0.3).with_structured_output(OrderProcessingResponse)
@@ -68,6 +108,7 @@ def get_order_processing_chain():
     return prompt | model
 
 
+@lru_cache(maxsize=1)
 def get_menu_display_chain():
     """Get chain for displaying menu items."""
     model = get_chat_model()
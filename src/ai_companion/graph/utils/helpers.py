@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 from langchain_core.output_parsers import StrOutputParser
 from langchain_groq import ChatGroq
@@ -8,8 +9,14 @@ from ai_companion.modules.image.text_to_image import TextToImage
 from ai_companion.modules.speech import TextToSpeech
 from ai_companion.settings import settings
 
+# Matches inline *stage directions* stripped from model output
+_ASTERISK_CONTENT_RE = re.compile(r"\*.*?\*")
 
+
+@lru_cache(maxsize=8)
 def get_chat_model(temperature: float = 0.7):
+    # One client per temperature, shared across turns: chains bind the model
+    # without mutating it, and reusing it keeps its HTTP connection pool warm.
     return ChatGroq(
         api_key=settings.GROQ_API_KEY,
         model_name=settings.TEXT_MODEL_NAME,
@@ -31,7 +38,10 @@ def get_image_to_text_module():
 
 def remove_asterisk_content(text: str) -> str:
     """Remove content between asterisks from the text."""
-    return re.sub(r"\*.*?\*", "", text).strip()
+    # Most replies have no stage directions at all; skip the regex pass
+    if "*" not in text:
+        return text.strip()
+    return _ASTERISK_CONTENT_RE.sub("", text).strip()
 
 
 class AsteriskRemovalParser(StrOutputParser):
@@ -131,24 +131,7 @@ async def generate_dynamic_message(
         return _get_fallback_message(message_type, context or {})
 
     try:
-        # Get template and prepare context
-        template = MESSAGE_TEMPLATES[message_type]
-        ctx = context or {}
-
-        # Add language context
-        language = settings.LANGUAGE or "auto"
-        if language == "auto":
-            language = "auto-detect from context (default to English if unclear)"
-        ctx["language"] = language
-
-        # Create prompt and chain
-        prompt = ChatPromptTemplate.from_template(template)
-        llm = get_chat_model(temperature=temperature)
-        chain = prompt | llm | StrOutputParser()
-
-        # Generate message
-        message = await chain.ainvoke(ctx)
-        return message.strip()
+        return await generate_llm_message(message_type, context, temperature)
 
     except Exception as e:
         logger.error(f"Error generating message for type '{message_type}': {e}", exc_info=True)
@@ -156,6 +139,48 @@ async def generate_dynamic_message(
         return _get_fallback_message(message_type, context or {})
 
 
+async def generate_llm_message(
+    message_type: str,
+    context: dict = None,
+    temperature: float = 0.5
+) -> str:
+    """
+    Generate a message with the LLM, without the static fallback.
+
+    Callers that cache the generated text use this, so a fallback served
+    during an LLM outage is never cached in place of a generated message.
+
+    Args:
+        message_type: One of MESSAGE_TEMPLATES keys
+        context: Dictionary with context variables
+        temperature: LLM temperature
+
+    Returns:
+        Generated message string
+
+    Raises:
+        KeyError: If message_type has no template
+        Exception: Any error raised by the LLM chain
+    """
+    template = MESSAGE_TEMPLATES[message_type]
+    ctx = dict(context or {})
+
+    # Add language context
+    language = settings.LANGUAGE or "auto"
+    if language == "auto":
+        language = "auto-detect from context (default to English if unclear)"
+    ctx["language"] = language
+
+    # Create prompt and chain
+    prompt = ChatPromptTemplate.from_template(template)
+    llm = get_chat_model(temperature=temperature)
+    chain = prompt | llm | StrOutputParser()
+
+    # Generate message
+    message = await chain.ainvoke(ctx)
+    return message.strip()
+
+
 def _get_fallback_message(message_type: str, context: dict) -> str:
     """
     Fallback messages in case AI generation fails.
@@ -0,0 +1,141 @@
+"""Semantic cache for conversation replies.
+
+Replies are grouped by an exact scope (everything besides the customer's
+message that shapes the prompt) and matched on the embedding of the normalized
+customer message, so paraphrased repeats in the same context skip the LLM.
+Identical requests that arrive while a reply is still being generated share
+that generation instead of starting their own.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+from ai_companion.modules.memory.long_term.vector_store import get_vector_store
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(message: str) -> str:
+    return " ".join(message.lower().split())
+
+
+@lru_cache(maxsize=256)
+def _embed(normalized_message: str) -> np.ndarray:
+    # Reuses the memory store's sentence-transformer, which is already loaded
+    # by the memory nodes; embeddings are unit length so dot == cosine
+    return get_vector_store().model.encode(normalized_message, normalize_embeddings=True)
+
+
+class SemanticCache:
+    """Bounded LRU of conversation replies with nearest-neighbour lookup."""
+
+    def __init__(self, max_entries: int = 256, similarity_threshold: float = 0.95):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        # (scope, normalized message) -> (embedding, reply)
+        self._entries: "OrderedDict[Tuple[Hashable, str], Tuple[np.ndarray, str]]" = OrderedDict()
+        # (scope, normalized message) -> reply generation still in flight
+        self._pending: Dict[Tuple[Hashable, str], "asyncio.Task[str]"] = {}
+
+    @staticmethod
+    def is_cacheable(message) -> bool:
+        """Check whether a customer message can be answered from the cache.
+
+        Tagged messages (e.g. "[User shared location: ...]") carry per-user
+        state and are never cached.
+        """
+        return isinstance(message, str) and bool(message.strip()) and not message.lstrip().startswith("[")
+
+    async def get(self, message: str, scope: Hashable) -> Optional[str]:
+        """Return a cached reply for a message similar to ``message`` in ``scope``."""
+        normalized = _normalize(message)
+        key = (scope, normalized)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        candidates = [(k, v) for k, v in self._entries.items() if k[0] == scope]
+        if not candidates:
+            return None
+
+        query = await asyncio.to_thread(_embed, normalized)
+        similarities = np.stack([embedding for _, (embedding, _) in candidates]) @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+
+        best_key, (_, reply) = candidates[best]
+        self._entries.move_to_end(best_key)
+        logger.debug(f"Semantic cache hit ({similarities[best]:.3f}) for: {message!r}")
+        return reply
+
+    async def set(self, message: str, scope: Hashable, reply: str) -> None:
+        """Store the reply generated for ``message`` in ``scope``."""
+        normalized = _normalize(message)
+        embedding = await asyncio.to_thread(_embed, normalized)
+        self._store((scope, normalized), embedding, reply)
+
+    def _store(self, key: Tuple[Hashable, str], embedding: np.ndarray, reply: str) -> None:
+        self._entries[key] = (embedding, reply)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_generate(
+        self, message: str, scope: Hashable, generate: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Return a cached reply, or generate and cache one.
+
+        Concurrent callers with the same normalized message and scope await a
+        single ``generate()`` call. The reply is cached even if the caller
+        that started it is cancelled before it completes.
+        """
+        cached = await self.get(message, scope)
+        if cached is not None:
+            return cached
+
+        key = (scope, _normalize(message))
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._generate_and_store(key, generate))
+            self._pending[key] = pending
+            pending.add_done_callback(partial(self._finish_pending, key))
+
+        # Shielded so a cancelled waiter doesn't cancel the shared call
+        return await asyncio.shield(pending)
+
+    async def _generate_and_store(self, key: Tuple[Hashable, str], generate: Callable[[], Awaitable[str]]) -> str:
+        # Embed while the reply is generated so storing it adds no latency
+        embedding = asyncio.ensure_future(asyncio.to_thread(_embed, key[1]))
+        try:
+            reply = await generate()
+        except BaseException:
+            embedding.cancel()
+            raise
+
+        try:
+            self._store(key, await embedding, reply)
+        except Exception as e:
+            logger.warning(f"Failed to cache reply: {e}")
+        return reply
+
+    def _finish_pending(self, key: Tuple[Hashable, str], task: "asyncio.Future[str]") -> None:
+        # Runs once the reply is stored, so later callers hit the cache instead
+        # of starting a second generation. Retrieving the exception keeps a
+        # failure nobody awaits from being reported as unretrieved.
+        self._pending.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Reply generation failed: {task.exception()!r}")
+
+
+@lru_cache
+def get_semantic_cache() -> SemanticCache:
+    """Get or create the process-wide conversation reply cache."""
+    return SemanticCache()
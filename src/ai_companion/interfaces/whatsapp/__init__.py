@@ -1,48 +1,52 @@
-"""WhatsApp interface module - V2 components with API support."""
-
-# Export V2 components by default
-from ai_companion.interfaces.whatsapp.interactive_components_v2 import (
-    create_size_selection_buttons,
-    create_extras_list,
-    create_modifiers_list,
-    create_category_selection_list,
-    create_button_component,
-    create_list_component,
-    extract_modifier_selections,
-    extract_presentation_id,
-)
-
-from ai_companion.interfaces.whatsapp.carousel_components_v2 import (
-    create_carousel_card,
-    create_carousel_component,
-    create_product_carousel,
-    create_api_menu_carousel,
-    create_category_products_carousel,
-    create_offer_carousel,
-)
-
-# Legacy components still available for backward compatibility
-from ai_companion.interfaces.whatsapp import interactive_components as interactive_components_legacy
-from ai_companion.interfaces.whatsapp import carousel_components as carousel_components_legacy
-
-__all__ = [
+"""WhatsApp interface module - V2 components with API support.
+
+Exports are resolved lazily on first attribute access so that importing a
+single submodule (e.g. ``interactive_components``) doesn't pull in every
+component module of the package.
+"""
+
+from importlib import import_module
+
+_PACKAGE = "ai_companion.interfaces.whatsapp"
+
+# Export V2 components by default: public name -> (submodule, attribute)
+_LAZY_EXPORTS = {
     # V2 Interactive Components
-    "create_size_selection_buttons",
-    "create_extras_list",
-    "create_modifiers_list",
-    "create_category_selection_list",
-    "create_button_component",
-    "create_list_component",
-    "extract_modifier_selections",
-    "extract_presentation_id",
+    "create_size_selection_buttons": ("interactive_components_v2", "create_size_selection_buttons"),
+    "create_extras_list": ("interactive_components_v2", "create_extras_list"),
+    "create_modifiers_list": ("interactive_components_v2", "create_modifiers_list"),
+    "create_category_selection_list": ("interactive_components_v2", "create_category_selection_list"),
+    "create_button_component": ("interactive_components_v2", "create_button_component"),
+    "create_list_component": ("interactive_components_v2", "create_list_component"),
+    "extract_modifier_selections": ("interactive_components_v2", "extract_modifier_selections"),
+    "extract_presentation_id": ("interactive_components_v2", "extract_presentation_id"),
     # V2 Carousel Components
-    "create_carousel_card",
-    "create_carousel_component",
-    "create_product_carousel",
-    "create_api_menu_carousel",
-    "create_category_products_carousel",
-    "create_offer_carousel",
-    # Legacy modules
-    "interactive_components_legacy",
-    "carousel_components_legacy",
-]
+    "create_carousel_card": ("carousel_components_v2", "create_carousel_card"),
+    "create_carousel_component": ("carousel_components_v2", "create_carousel_component"),
+    "create_product_carousel": ("carousel_components_v2", "create_product_carousel"),
+    "create_api_menu_carousel": ("carousel_components_v2", "create_api_menu_carousel"),
+    "create_category_products_carousel": ("carousel_components_v2", "create_category_products_carousel"),
+    "create_offer_carousel": ("carousel_components_v2", "create_offer_carousel"),
+    # Legacy components still available for backward compatibility
+    "interactive_components_legacy": ("interactive_components", None),
+    "carousel_components_legacy": ("carousel_components", None),
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = import_module(f"{_PACKAGE}.{module_name}")
+    value = module if attr is None else getattr(module, attr)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,6 +7,8 @@ mock data and API product data.
 from typing import List, Dict, Optional, Literal
 import logging
 
+from ai_companion.interfaces.whatsapp.interactive_components_v2 import _get_category_emoji
+
 logger = logging.getLogger(__name__)
 
 
@@ -338,40 +340,5 @@ def create_offer_carousel(
     return create_carousel_component(body_text, cards)
 
 
-def _get_category_emoji(category_name: str) -> str:
-    """Get emoji for category name.
-
-    Args:
-        category_name: Category name
-
-    Returns:
-        Emoji string
-    """
-    name_lower = category_name.lower()
-
-    emoji_map = {
-        "pizza": "🍕",
-        "burger": "🍔",
-        "side": "🍟",
-        "drink": "🥤",
-        "dessert": "🍰",
-        "salad": "🥗",
-        "pasta": "🍝",
-        "soup": "🍜",
-        "sandwich": "🥪",
-        "chicken": "🍗",
-        "seafood": "🦐",
-        "breakfast": "🍳",
-        "coffee": "☕",
-        "ice cream": "🍦",
-    }
-
-    for key, emoji in emoji_map.items():
-        if key in name_lower:
-            return emoji
-
-    return "🍽️"
-
-
 # Backward compatibility alias
 create_menu_carousel = create_product_carousel
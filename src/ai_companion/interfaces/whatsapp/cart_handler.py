@@ -3,7 +3,7 @@
 Supports both V2 API patterns (presentation_id, modifiers) and legacy patterns.
 """
 import logging
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Final, Optional, Tuple, List
 from ai_companion.graph.state import AICompanionState
 from ai_companion.modules.cart import OrderStage
 # V2 helper functions for extracting API IDs
@@ -14,6 +14,21 @@ from ai_companion.interfaces.whatsapp.interactive_components_v2 import (
 
 logger = logging.getLogger(__name__)
 
+# Interaction ID prefixes that always denote a cart interaction
+_CART_ID_PREFIXES: Final[Tuple[str, ...]] = ("category_", "size_pres", "mod_", "prod_", "cat_")
+
+# Legacy menu categories, used as ID prefixes (e.g., "pizzas_0")
+_LEGACY_MENU_CATEGORY_PREFIXES: Final[Tuple[str, ...]] = ("pizzas", "burgers", "sides", "drinks", "desserts")
+
+# Exact-match ID groups, as frozensets for O(1) membership checks
+_LEGACY_EXTRAS = frozenset({
+    "extra_cheese", "mushrooms", "olives", "pepperoni", "bacon",
+    "chicken", "gluten_free", "vegan_cheese", "extra_sauce", "extra_toppings",
+})
+_LEGACY_MENU_CATEGORIES = frozenset(_LEGACY_MENU_CATEGORY_PREFIXES)
+_DELIVERY_METHOD_IDS = frozenset({"delivery", "pickup", "dine_in"})
+_PAYMENT_METHOD_IDS = frozenset({"credit_card", "debit_card", "mobile_payment", "cash"})
+
 
 class CartInteractionHandler:
     """Handles interactive component replies related to shopping cart."""
@@ -54,6 +69,83 @@ class CartInteractionHandler:
         "new_order": "new_order",
     }
 
+    # Routing for exact-match interaction IDs: id -> (node_name, state_updates)
+    EXACT_ACTIONS = {
+        # Cart navigation buttons
+        "view_cart": ("view_cart", {}),
+        "continue_shopping": ("show_menu", {"use_interactive_menu": True}),
+        "view_menu": ("view_menu", {}),
+        "checkout": ("checkout", {}),
+        "clear_cart": ("clear_cart", {}),
+
+        # Legacy extras (e.g., "extra_cheese", "mushrooms")
+        **{extra: ("handle_extras", {}) for extra in _LEGACY_EXTRAS},
+
+        # Delivery method
+        **{
+            method: ("handle_delivery_method", {"selected_delivery_method": method})
+            for method in _DELIVERY_METHOD_IDS
+        },
+
+        # Payment method
+        **{method: ("handle_payment_method", {}) for method in _PAYMENT_METHOD_IDS},
+
+        # Order confirmation
+        "confirm_order": ("confirm_order", {}),
+        "edit_order": ("view_cart", {}),
+        "cancel_order": ("clear_cart", {}),
+
+        # Post-order actions
+        "new_order": ("show_menu", {"use_interactive_menu": True}),
+        "track_order": ("conversation", {}),  # Let AI handle tracking inquiries
+        "contact_support": ("conversation", {}),  # Let AI handle support inquiries
+        "contact_us": ("conversation", {}),
+    }
+
+    # Natural language phrases for exact-match interaction IDs
+    INTERACTION_PHRASES = {
+        # Extras
+        "extra_cheese": "Please add extra cheese",
+        "mushrooms": "Please add mushrooms",
+        "olives": "Please add olives",
+        "pepperoni": "Please add pepperoni",
+        "bacon": "Please add bacon",
+        "chicken": "Please add grilled chicken",
+        "gluten_free": "Please make it gluten-free",
+        "vegan_cheese": "Please use vegan cheese",
+        "extra_sauce": "Please add extra sauce",
+        "extra_toppings": "Please add extra toppings",
+
+        # Cart actions
+        "view_cart": "Show me my cart",
+        "continue_shopping": "I want to add more items",
+        "checkout": "I'm ready to checkout",
+        "clear_cart": "Clear my cart",
+        "view_menu": "Show me the menu",
+
+        # Delivery methods
+        "delivery": "I'd like delivery",
+        "pickup": "I'll pick it up",
+        "dine_in": "I'll dine in",
+
+        # Payment methods
+        "credit_card": "I'll pay by credit card",
+        "debit_card": "I'll pay by debit card",
+        "mobile_payment": "I'll use mobile payment",
+        "cash": "I'll pay cash",
+
+        # Order confirmation actions
+        "confirm_order": "Yes, confirm my order",
+        "edit_order": "I want to edit my order",
+        "cancel_order": "Cancel my order",
+
+        # Post-order actions
+        "track_order": "I want to track my order",
+        "contact_support": "I need help with my order",
+        "contact_us": "I need to contact support",
+        "new_order": "I want to place a new order",
+    }
+
     @staticmethod
     def is_cart_interaction(interaction_id: str) -> bool:
         """Check if interaction is cart-related.
@@ -64,57 +156,45 @@ class CartInteractionHandler:
         Returns:
             True if cart-related, False otherwise
         """
+        # Fast path: interaction IDs never contain spaces, so free text typed
+        # by the user (checked here for deep links) is rejected in one scan
+        if " " in interaction_id:
+            return False
+
         # Check direct button matches
-        if interaction_id in CartInteractionHandler.CART_BUTTON_IDS.values():
+        if interaction_id in _CART_BUTTON_ID_SET:
             return True
 
-        # Check category selection pattern (e.g., "category_pizzas", "category_burgers")
-        if interaction_id.startswith("category_"):
+        # Prefix patterns, checked in a single startswith() call:
+        # - Legacy category selection (e.g., "category_pizzas")
+        # - V2 presentation ID (e.g., "size_pres001")
+        # - V2 modifier selection (e.g., "mod_mod001_opt001")
+        # - API product ID (e.g., "prod_6748abc123")
+        # - API category ID (e.g., "cat_6748abc123")
+        if interaction_id.startswith(_CART_ID_PREFIXES):
             return True
 
-        # Check menu item pattern (e.g., "pizzas_0", "burgers_1")
-        if "_" in interaction_id:
-            parts = interaction_id.split("_")
-            if len(parts) == 2:
-                category, idx = parts
-                if category in ["pizzas", "burgers", "sides", "drinks", "desserts"]:
-                    try:
-                        int(idx)
-                        return True
-                    except ValueError:
-                        pass
-
-        # Check add pattern for carousel follow-up buttons
-        # Legacy: "add_pizzas_0" or API: "add_product_prod001"
-        if interaction_id.startswith("add_"):
-            parts = interaction_id.split("_")
-            if len(parts) == 3:  # add_category_index (legacy) or add_product_{id}
-                return True
-
         # Check extras pattern (legacy)
-        extras = ["extra_cheese", "mushrooms", "olives", "pepperoni", "bacon",
-                  "chicken", "gluten_free", "vegan_cheese", "extra_sauce", "extra_toppings"]
-        if interaction_id in extras:
-            return True
-
-        # V2 API patterns
-        # Check presentation ID pattern (e.g., "size_pres001", "size_pres002")
-        if interaction_id.startswith("size_pres"):
-            return True
-
-        # Check modifier selection pattern (e.g., "mod_mod001_opt001")
-        if interaction_id.startswith("mod_"):
+        if interaction_id in _LEGACY_EXTRAS:
             return True
 
-        # Check product ID pattern from API (e.g., "prod_6748abc123", starts with prod_)
-        if interaction_id.startswith("prod_"):
-            return True
+        # Remaining patterns are underscore-separated; one partition serves both
+        head, separator, rest = interaction_id.partition("_")
+        if not separator:
+            return False
 
-        # Check category ID pattern from API (e.g., "cat_6748abc123", starts with cat_)
-        if interaction_id.startswith("cat_"):
-            return True
+        # Check menu item pattern (e.g., "pizzas_0", "burgers_1")
+        if head in _LEGACY_MENU_CATEGORIES and "_" not in rest:
+            try:
+                int(rest)
+                return True
+            except ValueError:
+                pass
 
-        return False
+        # Check add pattern for carousel follow-up buttons
+        # Legacy: "add_pizzas_0" or API: "add_product_prod001"
+        # add_category_index (legacy) or add_product_{id}
+        return head == "add" and rest.count("_") == 1
 
     @staticmethod
     def parse_interaction(
@@ -169,54 +249,36 @@ class CartInteractionHandler:
 
         # Legacy: Category selection (e.g., "category_pizzas", "category_burgers")
         if interaction_id.startswith("category_"):
-            category = interaction_id.replace("category_", "")
+            category = interaction_id[len("category_"):]
             return "view_category_carousel", {"selected_category": category}
 
         # Add item from carousel follow-up buttons
         # API format: "add_product_prod001" or Legacy: "add_pizzas_0"
         if interaction_id.startswith("add_"):
-            parts = interaction_id.split("_")
-            if len(parts) == 3:
-                if parts[1] == "product":
-                    # API format: add_product_{product_id}
-                    product_id = parts[2]
-                    return "add_to_cart", {
-                        "current_item": {"menu_item_id": product_id},
-                        "order_stage": OrderStage.SELECTING.value
-                    }
-                else:
-                    # Legacy format: add_{category}_{index}
-                    category, idx = parts[1], parts[2]
-                    menu_item_id = f"{category}_{idx}"
-                    return "add_to_cart", {
-                        "current_item": {"menu_item_id": menu_item_id},
-                        "order_stage": OrderStage.SELECTING.value
-                    }
+            kind, separator, item = interaction_id[len("add_"):].partition("_")
+            if separator and "_" not in item:
+                # API format: add_product_{product_id}
+                # Legacy format: add_{category}_{index} -> "{category}_{index}"
+                menu_item_id = item if kind == "product" else interaction_id[len("add_"):]
+                return "add_to_cart", {
+                    "current_item": {"menu_item_id": menu_item_id},
+                    "order_stage": OrderStage.SELECTING.value
+                }
 
         # Legacy: Menu item selection (e.g., "pizzas_0", "burgers_1")
-        if "_" in interaction_id and any(
-            interaction_id.startswith(cat) for cat in ["pizzas", "burgers", "sides", "drinks", "desserts"]
-        ):
+        if "_" in interaction_id and interaction_id.startswith(_LEGACY_MENU_CATEGORY_PREFIXES):
             return "add_to_cart", {
                 "current_item": {"menu_item_id": interaction_id},
                 "order_stage": OrderStage.SELECTING.value
             }
 
-        # Cart navigation buttons
-        if interaction_id == "view_cart":
-            return "view_cart", {}
-
-        if interaction_id == "continue_shopping":
-            return "show_menu", {"use_interactive_menu": True}
-
-        if interaction_id == "view_menu":
-            return "view_menu", {}
-
-        if interaction_id == "checkout":
-            return "checkout", {}
-
-        if interaction_id == "clear_cart":
-            return "clear_cart", {}
+        # Exact-match buttons and list rows (navigation, extras, delivery,
+        # payment, confirmation, post-order) resolve with one dict lookup.
+        # Copy the updates template: callers add keys to the returned dict.
+        action = CartInteractionHandler.EXACT_ACTIONS.get(interaction_id)
+        if action is not None:
+            node_name, state_updates = action
+            return node_name, dict(state_updates)
 
         # V2 API: Size selection with presentation ID (e.g., "size_pres001")
         # Legacy: Size selection (e.g., "size_small", "size_medium", "size_large")
@@ -225,44 +287,9 @@ class CartInteractionHandler:
             return "handle_size", {}
 
         # V2 API: Modifier selection (e.g., "mod_mod001_opt001")
-        # Legacy: Extras selection (e.g., "extra_cheese", "mushrooms")
         if interaction_id.startswith("mod_"):
             return "handle_extras", {}
 
-        # Legacy extras
-        extras = ["extra_cheese", "mushrooms", "olives", "pepperoni", "bacon",
-                  "chicken", "gluten_free", "vegan_cheese", "extra_sauce", "extra_toppings"]
-        if interaction_id in extras:
-            return "handle_extras", {}
-
-        # Delivery method
-        if interaction_id in ["delivery", "pickup", "dine_in"]:
-            return "handle_delivery_method", {"selected_delivery_method": interaction_id}
-
-        # Payment method
-        if interaction_id in ["credit_card", "debit_card", "mobile_payment", "cash"]:
-            return "handle_payment_method", {}
-
-        # Order confirmation
-        if interaction_id == "confirm_order":
-            return "confirm_order", {}
-
-        if interaction_id == "edit_order":
-            return "view_cart", {}
-
-        if interaction_id == "cancel_order":
-            return "clear_cart", {}
-
-        # Post-order actions
-        if interaction_id == "new_order":
-            return "show_menu", {"use_interactive_menu": True}
-
-        if interaction_id == "track_order":
-            return "conversation", {}  # Let AI handle tracking inquiries
-
-        if interaction_id == "contact_support" or interaction_id == "contact_us":
-            return "conversation", {}  # Let AI handle support inquiries
-
         # Default: conversation
         return "conversation", {}
 
@@ -286,7 +313,7 @@ class CartInteractionHandler:
         """
         # Category selection
         if interaction_id.startswith("category_"):
-            category = interaction_id.replace("category_", "")
+            category = interaction_id[len("category_"):]
             return f"Show me the {category}"
 
         # Add item from carousel buttons
@@ -294,80 +321,18 @@ class CartInteractionHandler:
             return f"I'd like to order the {title.replace('Add ', '')}"
 
         # Menu item selections
-        if "_" in interaction_id and any(
-            interaction_id.startswith(cat) for cat in ["pizzas", "burgers", "sides", "drinks", "desserts"]
-        ):
+        if "_" in interaction_id and interaction_id.startswith(_LEGACY_MENU_CATEGORY_PREFIXES):
             return f"I'd like to order the {title}"
 
         # Size selections
         if interaction_id.startswith("size_"):
-            size = interaction_id.replace("size_", "").title()
+            size = interaction_id[len("size_"):].title()
             return f"I'll take the {size} size"
 
-        # Extras
-        extras_map = {
-            "extra_cheese": "add extra cheese",
-            "mushrooms": "add mushrooms",
-            "olives": "add olives",
-            "pepperoni": "add pepperoni",
-            "bacon": "add bacon",
-            "chicken": "add grilled chicken",
-            "gluten_free": "make it gluten-free",
-            "vegan_cheese": "use vegan cheese",
-            "extra_sauce": "add extra sauce",
-            "extra_toppings": "add extra toppings"
-        }
-        if interaction_id in extras_map:
-            return f"Please {extras_map[interaction_id]}"
-
-        # Cart actions
-        cart_actions = {
-            "view_cart": "Show me my cart",
-            "continue_shopping": "I want to add more items",
-            "checkout": "I'm ready to checkout",
-            "clear_cart": "Clear my cart",
-            "view_menu": "Show me the menu"
-        }
-        if interaction_id in cart_actions:
-            return cart_actions[interaction_id]
-
-        # Delivery methods
-        delivery_map = {
-            "delivery": "I'd like delivery",
-            "pickup": "I'll pick it up",
-            "dine_in": "I'll dine in"
-        }
-        if interaction_id in delivery_map:
-            return delivery_map[interaction_id]
-
-        # Payment methods
-        payment_map = {
-            "credit_card": "I'll pay by credit card",
-            "debit_card": "I'll pay by debit card",
-            "mobile_payment": "I'll use mobile payment",
-            "cash": "I'll pay cash"
-        }
-        if interaction_id in payment_map:
-            return payment_map[interaction_id]
-
-        # Order confirmation actions
-        confirmation_map = {
-            "confirm_order": "Yes, confirm my order",
-            "edit_order": "I want to edit my order",
-            "cancel_order": "Cancel my order"
-        }
-        if interaction_id in confirmation_map:
-            return confirmation_map[interaction_id]
-
-        # Post-order actions
-        post_order_map = {
-            "track_order": "I want to track my order",
-            "contact_support": "I need help with my order",
-            "contact_us": "I need to contact support",
-            "new_order": "I want to place a new order"
-        }
-        if interaction_id in post_order_map:
-            return post_order_map[interaction_id]
+        # Extras, cart, delivery, payment, confirmation and post-order actions
+        phrase = CartInteractionHandler.INTERACTION_PHRASES.get(interaction_id)
+        if phrase is not None:
+            return phrase
 
         # Default: use title
         return title
@@ -416,6 +381,15 @@ class CartInteractionHandler:
         return result
 
 
+_CART_BUTTON_ID_SET = frozenset(CartInteractionHandler.CART_BUTTON_IDS.values())
+
+# Exact-match IDs resolved in one lookup: id -> (node_name, state_updates, text)
+_EXACT_INTERACTIONS = {
+    interaction_id: (node_name, state_updates, CartInteractionHandler.INTERACTION_PHRASES.get(interaction_id))
+    for interaction_id, (node_name, state_updates) in CartInteractionHandler.EXACT_ACTIONS.items()
+}
+
+
 def process_cart_interaction(
     interaction_type: str,
     interaction_data: Dict,
@@ -440,6 +414,15 @@ def process_cart_interaction(
 
     logger.info(f"Cart interaction: type={interaction_type}, id={interaction_id}, title={title}")
 
+    # Fast path: exact-match buttons carry no V2 data, so routing and text
+    # come from a single table lookup instead of three separate ID scans
+    exact = _EXACT_INTERACTIONS.get(interaction_id)
+    if exact is not None:
+        node_name, state_updates, text_repr = exact
+        text_repr = text_repr or title
+        logger.info(f"Routing to node: {node_name}, state_updates: {state_updates}, text: {text_repr}")
+        return node_name, dict(state_updates), text_repr
+
     # Check if this is cart-related
     if not handler.is_cart_interaction(interaction_id):
         return "conversation", {}, title
@@ -1,6 +1,35 @@
 """Helper functions for creating WhatsApp interactive components."""
+from functools import lru_cache
 from typing import List, Dict, Optional
 
+# Static button specs, shared between calls. create_button_component copies
+# them into the component, so they are never handed to callers.
+_ORDER_CONFIRMATION_BUTTONS = (
+    {"id": "confirm_delivery", "title": "Livraison 🚗"},
+    {"id": "confirm_pickup", "title": "Pickup 🏃"},
+    {"id": "cancel_order", "title": "Annuler ❌"},
+)
+_ITEM_ADDED_BUTTONS = (
+    {"id": "continue_shopping", "title": "➕ Ajouter Plus"},
+    {"id": "view_cart", "title": "🛒 Voir Panier"},
+    {"id": "checkout", "title": "✅ Payer"},
+)
+_CART_VIEW_BUTTONS = (
+    {"id": "checkout", "title": "✅ Payer"},
+    {"id": "continue_shopping", "title": "➕ Ajouter Plus"},
+    {"id": "clear_cart", "title": "🗑️ Vider le Panier"},
+)
+
+# Category names to display names with emojis
+_CATEGORY_DISPLAY_NAMES = {
+    "pizzas": "🍕 Pizzas",
+    "burgers": "🍔 Burgers",
+    "sides": "🍟 Sides",
+    "drinks": "🥤 Drinks",
+    "desserts": "🍰 Desserts",
+}
+_DEFAULT_MENU_CATEGORIES = ("pizzas", "burgers", "sides")
+
 
 def create_button_component(
     body_text: str,
@@ -229,19 +258,10 @@ def create_category_menu_buttons(available_categories: List[str] = None) -> Dict
         create_category_menu_buttons(["pizzas", "burgers", "sides"])
     """
     if available_categories is None:
-        available_categories = ["pizzas", "burgers", "sides"]
-
-    # Map categories to display names with emojis
-    category_display = {
-        "pizzas": "🍕 Pizzas",
-        "burgers": "🍔 Burgers",
-        "sides": "🍟 Sides",
-        "drinks": "🥤 Drinks",
-        "desserts": "🍰 Desserts"
-    }
+        available_categories = _DEFAULT_MENU_CATEGORIES
 
     buttons = [
-        {"id": f"category_{cat}", "title": category_display.get(cat, cat.title())}
+        {"id": f"category_{cat}", "title": _CATEGORY_DISPLAY_NAMES.get(cat, cat.title())}
         for cat in available_categories[:3]  # Max 3 buttons
     ]
 
@@ -299,18 +319,18 @@ def create_order_confirmation_buttons(order_total: float) -> Dict:
     """
     return create_button_component(
         f"Your order total is ${order_total:.2f}. How would you like to receive it?",
-        [
-            {"id": "confirm_delivery", "title": "Livraison 🚗"},
-            {"id": "confirm_pickup", "title": "Pickup 🏃"},
-            {"id": "cancel_order", "title": "Annuler ❌"}
-        ],
+        _ORDER_CONFIRMATION_BUTTONS,
         header_text="Confirmation de commande"
     )
 
 
+@lru_cache(maxsize=None)
 def create_quick_actions_buttons() -> Dict:
     """Create quick action buttons for common restaurant tasks.
 
+    The component is static, so it is built once and shared between calls;
+    callers must not mutate it.
+
     Returns:
         Interactive button component
     """
@@ -338,11 +358,7 @@ def create_item_added_buttons(item_name: str, cart_total: float, item_count: int
     """
     return create_button_component(
         f"Ajouter {item_name} a mon panier!",
-        [
-            {"id": "continue_shopping", "title": "➕ Ajouter Plus"},
-            {"id": "view_cart", "title": "🛒 Voir Panier"},
-            {"id": "checkout", "title": "✅ Payer"}
-        ],
+        _ITEM_ADDED_BUTTONS,
         footer_text=f"{item_count} articles • ${cart_total:.2f}"
     )
 
@@ -359,11 +375,7 @@ def create_cart_view_buttons(cart_total: float, item_count: int) -> Dict:
     """
     return create_button_component(
         f"Votre panier a {item_count} article{'s' if item_count != 1 else ''}",
-        [
-            {"id": "checkout", "title": "✅ Payer"},
-            {"id": "continue_shopping", "title": "➕ Ajouter Plus"},
-            {"id": "clear_cart", "title": "🗑️ Vider le Panier"}
-        ],
+        _CART_VIEW_BUTTONS,
         header_text=f"Total: ${cart_total:.2f}"
     )
 
@@ -392,9 +404,13 @@ def create_size_selection_buttons(item_name: str, base_price: float) -> Dict:
     )
 
 
+@lru_cache(maxsize=None)
 def create_extras_list(category: str = "pizza") -> Dict:
     """Create list of extras/toppings for customization.
 
+    The list only depends on the category, so each variant is built once
+    and shared between calls; callers must not mutate it.
+
     Args:
         category: Menu item category (pizza, burger, etc.)
 
@@ -458,9 +474,13 @@ def create_extras_list(category: str = "pizza") -> Dict:
     )
 
 
+@lru_cache(maxsize=None)
 def create_delivery_method_buttons() -> Dict:
     """Create delivery method selection buttons.
 
+    The component is static, so it is built once and shared between calls;
+    callers must not mutate it.
+
     Returns:
         Interactive button component
     """
@@ -475,9 +495,13 @@ def create_delivery_method_buttons() -> Dict:
     )
 
 
+@lru_cache(maxsize=None)
 def create_payment_method_list() -> Dict:
     """Create payment method selection list.
 
+    The component is static, so it is built once and shared between calls;
+    callers must not mutate it.
+
     Returns:
         Interactive list component
     """
@@ -564,10 +588,12 @@ Total : ${total:.2f} FCFA
         footer_text=f"Temps estimé : {order_data.get('estimated_time', '30-45 min')}" # Translated
     )
 
+@lru_cache(maxsize=None)
 def create_category_selection_list() -> Dict:
     """Create interactive list for selecting menu categories.
 
-    Shows all menu categories with item counts for users to browse.
+    Shows all menu categories with item counts for users to browse. The mock
+    menu is static, so the list is built once and shared between calls.
 
     Returns:
         Interactive list component for category selection
@@ -4,8 +4,10 @@ This module provides backward-compatible interactive component creators
 that work with both mock data and API data (presentations and modifiers).
 """
 
+from functools import lru_cache
 from typing import List, Dict, Optional
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -119,29 +121,8 @@ def create_product_list(
     if not header_text:
         header_text = f"{category_name} Menu"
 
-    # Build product rows
-    rows = []
-    for product in products[:10]:  # WhatsApp limit: 10 rows
-        product_id = product.get("id", "")
-        name = product.get("name", "Unknown Product")
-
-        # Handle both basePrice (API) and price (mock) fields
-        price = product.get("basePrice") or product.get("price", 0)
-
-        # Format price
-        if price % 1 == 0:  # Whole number
-            price_str = f"${int(price)}"
-        else:
-            price_str = f"${price:.2f}"
-
-        title = f"{name} - {price_str}"
-        description = product.get("description", "")
-
-        rows.append({
-            "id": f"add_product_{product_id}",
-            "title": title[:24],  # WhatsApp limit
-            "description": description[:72] if description else f"Price: {price_str}"
-        })
+    # Build product rows (WhatsApp limit: 10 rows)
+    rows = [_product_row(product) for product in products[:10]]
 
     # Create list component
     return create_list_component(
@@ -156,6 +137,27 @@ def create_product_list(
     )
 
 
+def _product_row(product: Dict) -> Dict:
+    """Build a single product list row."""
+    # Handle both basePrice (API) and price (mock) fields
+    price = product.get("basePrice") or product.get("price", 0)
+
+    # Format price
+    if price % 1 == 0:  # Whole number
+        price_str = f"${int(price)}"
+    else:
+        price_str = f"${price:.2f}"
+
+    title = f"{product.get('name', 'Unknown Product')} - {price_str}"
+    description = product.get("description", "")
+
+    return {
+        "id": f"add_product_{product.get('id', '')}",
+        "title": title[:24],  # WhatsApp limit
+        "description": description[:72] if description else f"Price: {price_str}",
+    }
+
+
 # ============================================
 # SIZE SELECTION - WITH API SUPPORT
 # ============================================
@@ -223,21 +225,10 @@ def create_extras_list(
             if not options:
                 continue
 
-            rows = []
-            for option in options[:10]:
-                option_id = option.get("_id")
-                option_name = option.get("name", "Inconnu")
-                option_price = option.get("price", 0.0)
-
-                price_display = f"+{option_price:.2f}€" if option_price > 0 else "Gratuit"
-
-                rows.append(
-                    {
-                        "id": f"extra_{option_id}",
-                        "title": option_name[:24],
-                        "description": price_display,
-                    }
-                )
+            rows = [
+                _option_row(f"extra_{option.get('_id')}", option)
+                for option in options[:10]
+            ]
 
             if rows:
                 sections.append({"title": modifier_name[:24], "rows": rows})
@@ -288,18 +279,11 @@ def create_extras_list(
 
     # "No extras" → "Sans extra"
     if sections:
+        no_extras_row = {"id": "no_extras", "title": "Sans extra", "description": "0.00€"}
         if len(sections[0].get("rows", [])) < 10:
-            sections[0]["rows"].insert(
-                0, {"id": "no_extras", "title": "Sans extra", "description": "0.00€"}
-            )
+            sections[0]["rows"].insert(0, no_extras_row)
         else:
-            sections.insert(
-                0,
-                {
-                    "title": "Options",
-                    "rows": [{"id": "no_extras", "title": "Sans extra", "description": "0.00€"}],
-                },
-            )
+            sections.insert(0, {"title": "Options", "rows": [no_extras_row]})
 
     return create_list_component(
         f"Choisissez vos extras (jusqu'à {max_selections}) :",
@@ -309,6 +293,20 @@ def create_extras_list(
     )
 
 
+def _format_option_price(option_price: float) -> str:
+    """Format an extra/modifier surcharge for a list row."""
+    return f"+{option_price:.2f}€" if option_price > 0 else "Gratuit"
+
+
+def _option_row(row_id: str, option: Dict) -> Dict:
+    """Build the list row for one API extra/modifier option."""
+    return {
+        "id": row_id,
+        "title": option.get("name", "Inconnu")[:24],
+        "description": _format_option_price(option.get("price", 0.0)),
+    }
+
+
 def create_modifiers_list(
     item_name: str, modifiers: List[Dict], max_total_rows: int = 10
 ) -> Dict:
@@ -337,23 +335,12 @@ def create_modifiers_list(
 
         section_title = f"{modifier_name}{title_suffix}"[:24]
 
-        rows = []
         remaining_rows = max_total_rows - total_rows
-
-        for option in options[:remaining_rows]:
-            option_id = option.get("_id")
-            option_name = option.get("name", "Inconnu")
-            option_price = option.get("price", 0.0)
-
-            price_display = f"+{option_price:.2f}€" if option_price > 0 else "Gratuit"
-
-            rows.append(
-                {
-                    "id": f"mod_{modifier.get('_id')}_{option_id}",
-                    "title": option_name[:24],
-                    "description": price_display,
-                }
-            )
+        modifier_id = modifier.get("_id")
+        rows = [
+            _option_row(f"mod_{modifier_id}_{option.get('_id')}", option)
+            for option in options[:remaining_rows]
+        ]
 
         if rows:
             sections.append({"title": section_title, "rows": rows})
@@ -376,43 +363,41 @@ def create_modifiers_list(
 
 
 def create_category_selection_list(categories: Optional[List[Dict]] = None) -> Dict:
-    """Create category selection list."""
-    sections = []
+    """Create category selection list.
 
-    if categories:
-        rows = []
-        for category in categories[:10]:
-            cat_id = category.get("id")
-            cat_name = category.get("name", "Inconnu")
-            product_count = len(category.get("products", []))
+    Without categories the static default list is returned; it is built
+    once and shared between calls, so callers must not mutate it.
+    """
+    if not categories:
+        return _create_default_category_selection_list()
 
-            emoji = _get_category_emoji(cat_name)
+    rows = [_category_row(category) for category in categories[:10]]
+    sections = [{"title": "Catégories du menu", "rows": rows}]
 
-            rows.append(
-                {
-                    "id": f"cat_{cat_id}",
-                    "title": f"{emoji} {cat_name}"[:24],
-                    "description": f"{product_count} articles",
-                }
-            )
+    return _create_category_list_component(sections)
 
-        if rows:
-            sections = [{"title": "Catégories du menu", "rows": rows}]
 
-    else:
-        sections = [
-            {
-                "title": "🍽️ Menu",
-                "rows": [
-                    {"id": "cat_pizzas", "title": "🍕 Pizzas", "description": "5 articles"},
-                    {"id": "cat_burgers", "title": "🍔 Burgers", "description": "4 articles"},
-                    {"id": "cat_sides", "title": "🍟 Accompagnements", "description": "4 articles"},
-                    {"id": "cat_drinks", "title": "🥤 Boissons", "description": "4 articles"},
-                    {"id": "cat_desserts", "title": "🍰 Desserts", "description": "3 articles"},
-                ],
-            }
-        ]
+@lru_cache(maxsize=None)
+def _create_default_category_selection_list() -> Dict:
+    """Build the static fallback category list (mock menu categories)."""
+    sections = [
+        {
+            "title": "🍽️ Menu",
+            "rows": [
+                {"id": "cat_pizzas", "title": "🍕 Pizzas", "description": "5 articles"},
+                {"id": "cat_burgers", "title": "🍔 Burgers", "description": "4 articles"},
+                {"id": "cat_sides", "title": "🍟 Accompagnements", "description": "4 articles"},
+                {"id": "cat_drinks", "title": "🥤 Boissons", "description": "4 articles"},
+                {"id": "cat_desserts", "title": "🍰 Desserts", "description": "3 articles"},
+            ],
+        }
+    ]
 
+    return _create_category_list_component(sections)
+
+
+def _create_category_list_component(sections: List[Dict]) -> Dict:
+    """Wrap category sections in the category selection list component."""
     return create_list_component(
         "Que souhaitez-vous commander ? Consultez notre menu ci-dessous :",
         sections,
@@ -421,32 +406,51 @@ def create_category_selection_list(categories: Optional[List[Dict]] = None) -> D
     )
 
 
-def _get_category_emoji(category_name: str) -> str:
-    """Get emoji for category name."""
-    name_lower = category_name.lower()
-
-    emoji_map = {
-        "pizza": "🍕",
-        "burger": "🍔",
-        "side": "🍟",
-        "drink": "🥤",
-        "dessert": "🍰",
-        "salad": "🥗",
-        "pasta": "🍝",
-        "soup": "🍜",
-        "sandwich": "🥪",
-        "chicken": "🍗",
-        "seafood": "🦐",
-        "breakfast": "🍳",
-        "coffee": "☕",
-        "ice cream": "🍦",
+_CATEGORY_EMOJI_KEYWORDS = (
+    ("pizza", "🍕"),
+    ("burger", "🍔"),
+    ("side", "🍟"),
+    ("drink", "🥤"),
+    ("dessert", "🍰"),
+    ("salad", "🥗"),
+    ("pasta", "🍝"),
+    ("soup", "🍜"),
+    ("sandwich", "🥪"),
+    ("chicken", "🍗"),
+    ("seafood", "🦐"),
+    ("breakfast", "🍳"),
+    ("coffee", "☕"),
+    ("ice cream", "🍦"),
+)
+_CATEGORY_EMOJI_PRIORITY = {key: index for index, (key, _) in enumerate(_CATEGORY_EMOJI_KEYWORDS)}
+# Zero-width lookahead so overlapping keywords are all reported
+_CATEGORY_EMOJI_RE = re.compile(
+    "(?=(" + "|".join(re.escape(key) for key, _ in _CATEGORY_EMOJI_KEYWORDS) + "))"
+)
+
+
+def _category_row(category: Dict) -> Dict:
+    """Build a single category list row."""
+    cat_name = category.get("name", "Inconnu")
+    emoji = _get_category_emoji(cat_name)
+
+    return {
+        "id": f"cat_{category.get('id')}",
+        "title": f"{emoji} {cat_name}"[:24],
+        "description": f"{len(category.get('products', []))} articles",
     }
 
-    for key, emoji in emoji_map.items():
-        if key in name_lower:
-            return emoji
 
-    return "🍽️"
+def _get_category_emoji(category_name: str) -> str:
+    """Get emoji for category name."""
+    # Collect every keyword in one pass; the earliest entry in the map wins,
+    # matching the previous first-hit loop over the dict.
+    matches = _CATEGORY_EMOJI_RE.findall(category_name.lower())
+    if not matches:
+        return "🍽️"
+
+    best = min(_CATEGORY_EMOJI_PRIORITY[match] for match in matches)
+    return _CATEGORY_EMOJI_KEYWORDS[best][1]
 
 
 # ============================================
@@ -460,15 +464,10 @@ def extract_modifier_selections(selected_ids: List[str]) -> Dict[str, List[str]]
 
     for reply_id in selected_ids:
         if reply_id.startswith("mod_"):
-            parts = reply_id.split("_")
-            if len(parts) >= 3:
-                modifier_id = parts[1]
-                option_id = "_".join(parts[2:])
-
-                if modifier_id not in selections:
-                    selections[modifier_id] = []
-
-                selections[modifier_id].append(option_id)
+            # "mod_{modifier_id}_{option_id}"; option IDs may contain underscores
+            modifier_id, separator, option_id = reply_id[4:].partition("_")
+            if separator:
+                selections.setdefault(modifier_id, []).append(option_id)
 
     return selections
 
@@ -476,6 +475,6 @@ def extract_modifier_selections(selected_ids: List[str]) -> Dict[str, List[str]]
 def extract_presentation_id(reply_id: str) -> Optional[str]:
     """Extract presentation ID from size selection reply."""
     if reply_id.startswith("size_"):
-        return reply_id.replace("size_", "")
+        return reply_id[len("size_"):]
 
     return None
@@ -1,6 +1,17 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from ai_companion.graph.nodes import drain_background_tasks
 from ai_companion.interfaces.whatsapp.whatsapp_response import whatsapp_router
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Let in-flight memory extraction finish before the process exits
+    await drain_background_tasks()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(whatsapp_router)
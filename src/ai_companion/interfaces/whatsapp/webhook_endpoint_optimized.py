@@ -18,6 +18,7 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import httpx
 
+from ai_companion.graph.nodes import drain_background_tasks
 from ai_companion.interfaces.whatsapp.whatsapp_response import whatsapp_router
 from ai_companion.services.business_service_optimized import get_optimized_business_service
 
@@ -59,6 +60,10 @@ async def lifespan(app: FastAPI):
         # Shutdown
         logger.info("Shutting down WhatsApp Webhook Service...")
 
+        # Let in-flight memory extraction finish
+        await drain_background_tasks()
+        logger.info("Background tasks drained")
+
         # Close business service connections
         if hasattr(app.state, 'business_service'):
             await app.state.business_service.disconnect()
@@ -1,9 +1,10 @@
 import logging
 import os
 from io import BytesIO
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional
 
 import httpx
+import orjson
 from fastapi import APIRouter, Request, Response
 from langchain_core.messages import HumanMessage
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
@@ -21,7 +22,7 @@ from ai_companion.services.conversation_sync_helper import (
     add_message_to_conversation,
 )
 # Cart integration
-from ai_companion.interfaces.whatsapp.cart_handler import process_cart_interaction
+from ai_companion.interfaces.whatsapp.cart_handler import CartInteractionHandler, process_cart_interaction
 from ai_companion.graph import cart_nodes
 from ai_companion.interfaces.whatsapp.interactive_components_v2 import (
     create_category_selection_list,
@@ -31,6 +32,7 @@ from ai_companion.interfaces.whatsapp.interactive_components_v2 import (
 # Legacy imports for backward compatibility (will be migrated)
 from ai_companion.interfaces.whatsapp.interactive_components import (
     create_menu_list_from_restaurant_menu,
+    create_payment_method_list,
     create_quick_actions_buttons,
 )
 from ai_companion.interfaces.whatsapp.carousel_components_v2 import (
@@ -43,6 +45,11 @@ from ai_companion.interfaces.whatsapp.carousel_components import (
 from ai_companion.interfaces.whatsapp.image_utils import (
     prepare_menu_items_for_carousel,
 )
+from ai_companion.interfaces.whatsapp.location_components import (
+    create_location_message_payload,
+    create_location_request_component,
+    format_location_for_display,
+)
 from ai_companion.core.schedules import RESTAURANT_MENU
 from ai_companion.modules.cart import OrderStage
 from ai_companion.services.menu_adapter import MenuAdapter
@@ -61,6 +68,39 @@ whatsapp_router = APIRouter()
 WHATSAPP_TOKEN = os.getenv("WHATSAPP_TOKEN")
 WHATSAPP_PHONE_NUMBER_ID = os.getenv("WHATSAPP_PHONE_NUMBER_ID")
 
+class _CartNodeRoute(NamedTuple):
+    """Cart interaction answered by a single cart node."""
+
+    node: Callable[[Dict], Awaitable[Dict]]
+    apply_updates: bool  # Merge the cart handler's state updates first
+    fallback_text: str
+    msg_type: Optional[str]  # None picks button vs list from the returned component
+    ack: str
+
+
+_CART_NODE_ROUTES: Dict[str, _CartNodeRoute] = {
+    "add_to_cart": _CartNodeRoute(cart_nodes.add_to_cart_node, True, "Added to cart!", None, "Item added"),
+    "view_cart": _CartNodeRoute(cart_nodes.view_cart_node, False, "Your cart", "interactive_button", "Cart viewed"),
+    "checkout": _CartNodeRoute(cart_nodes.checkout_node, False, "Checkout", "interactive_button", "Checkout started"),
+    "handle_size": _CartNodeRoute(
+        cart_nodes.handle_size_selection_node, True, "Size selected", None, "Size selected"
+    ),
+    "handle_extras": _CartNodeRoute(
+        cart_nodes.handle_extras_selection_node, True, "Extra added", None, "Extra added"
+    ),
+    "handle_delivery_method": _CartNodeRoute(
+        cart_nodes.handle_delivery_method_node, True, "Delivery selected", "interactive_list",
+        "Delivery method selected",
+    ),
+    "handle_payment_method": _CartNodeRoute(
+        cart_nodes.handle_payment_method_node, True, "Payment selected", "interactive_button",
+        "Payment method selected",
+    ),
+    "confirm_order": _CartNodeRoute(
+        cart_nodes.confirm_order_node, False, "Order confirmed!", "interactive_button", "Order confirmed"
+    ),
+}
+
 
 @whatsapp_router.api_route("/whatsapp_response", methods=["GET", "POST"])
 async def whatsapp_handler(request: Request) -> Response:
@@ -73,7 +113,8 @@ async def whatsapp_handler(request: Request) -> Response:
         return Response(content="Verification token mismatch", status_code=403)
 
     try:
-        data = await request.json()
+        # orjson parses the webhook payload several times faster than stdlib json
+        data = orjson.loads(await request.body())
         change_value = data["entry"][0]["changes"][0]["value"]
         if "messages" in change_value:
             message = change_value["messages"][0]
@@ -226,6 +267,14 @@ async def whatsapp_handler(request: Request) -> Response:
 
                     logger.info(f"Cart handler routed to: {node_name}")
 
+                    # Cart nodes whose reply is sent straight back
+                    route = _CART_NODE_ROUTES.get(node_name)
+                    if route is not None:
+                        return await _run_cart_node(
+                            route, current_state_dict, state_updates, graph, session_id,
+                            from_number, phone_number_id, whatsapp_token,
+                        )
+
                     # Handle cart-specific nodes
                     if node_name == "show_menu":
                         # Show quick actions instead of direct menu
@@ -276,7 +325,7 @@ async def whatsapp_handler(request: Request) -> Response:
                         try:
                             # V2 pattern: "cat_{api_category_id}" -> extract API ID
                             if category_id and category_id.startswith("cat_"):
-                                api_category_id = category_id.replace("cat_", "")
+                                api_category_id = category_id[len("cat_"):]
                                 logger.info(f"V2 category selected: {category_id} -> API ID: {api_category_id}")
 
                                 # Fetch category with products from API
@@ -350,243 +399,6 @@ async def whatsapp_handler(request: Request) -> Response:
                         finally:
                             await menu_adapter.close()
 
-                    elif node_name == "add_to_cart":
-                        # Update state with selected item and user phone
-                        current_state_dict.update(state_updates)
-                        current_state_dict["user_phone"] = from_number
-                        result = await cart_nodes.add_to_cart_node(current_state_dict)
-
-                        # Persist state updates back to graph
-                        await graph.aupdate_state(
-                            config={"configurable": {"thread_id": session_id}},
-                            values=result
-                        )
-
-                        # Send response (messages is a single AIMessage object, not a list)
-                        message_obj = result.get("messages")
-                        response_message = message_obj.content if message_obj else "Added to cart!"
-                        interactive_comp = result.get("interactive_component")
-
-                        if interactive_comp:
-                            msg_type = "interactive_button" if interactive_comp.get("type") == "button" else "interactive_list"
-                            success = await send_response(
-                                from_number, response_message, msg_type,
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
-                                interactive_component=interactive_comp
-                            )
-                        else:
-                            success = await send_response(
-                                from_number, response_message, "text",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
-                            )
-
-                        return Response(content="Item added", status_code=200)
-
-                    elif node_name == "view_cart":
-                        current_state_dict["user_phone"] = from_number
-                        result = await cart_nodes.view_cart_node(current_state_dict)
-
-                        # Persist state updates back to graph
-                        await graph.aupdate_state(
-                            config={"configurable": {"thread_id": session_id}},
-                            values=result
-                        )
-
-                        message_obj = result.get("messages")
-                        response_message = message_obj.content if message_obj else "Your cart"
-                        interactive_comp = result.get("interactive_component")
-
-                        if interactive_comp:
-                            success = await send_response(
-                                from_number, response_message, "interactive_button",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
-                                interactive_component=interactive_comp
-                            )
-                        else:
-                            success = await send_response(
-                                from_number, response_message, "text",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
-                            )
-
-                        return Response(content="Cart viewed", status_code=200)
-
-                    elif node_name == "checkout":
-                        current_state_dict["user_phone"] = from_number
-                        result = await cart_nodes.checkout_node(current_state_dict)
-
-                        # Persist state updates back to graph
-                        await graph.aupdate_state(
-                            config={"configurable": {"thread_id": session_id}},
-                            values=result
-                        )
-
-                        message_obj = result.get("messages")
-                        response_message = message_obj.content if message_obj else "Checkout"
-                        interactive_comp = result.get("interactive_component")
-
-                        if interactive_comp:
-                            success = await send_response(
-                                from_number, response_message, "interactive_button",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
-                                interactive_component=interactive_comp
-                            )
-                        else:
-                            success = await send_response(
-                                from_number, response_message, "text",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
-                            )
-
-                        return Response(content="Checkout started", status_code=200)
-
-                    elif node_name == "handle_size":
-                        current_state_dict.update(state_updates)
-                        current_state_dict["user_phone"] = from_number
-                        result = await cart_nodes.handle_size_selection_node(current_state_dict)
-
-                        # Persist state updates back to graph
-                        await graph.aupdate_state(
-                            config={"configurable": {"thread_id": session_id}},
-                            values=result
-                        )
-
-                        message_obj = result.get("messages")
-                        response_message = message_obj.content if message_obj else "Size selected"
-                        interactive_comp = result.get("interactive_component")
-
-                        if interactive_comp:
-                            msg_type = "interactive_button" if interactive_comp.get("type") == "button" else "interactive_list"
-                            success = await send_response(
-                                from_number, response_message, msg_type,
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
-                                interactive_component=interactive_comp
-                            )
-                        else:
-                            success = await send_response(
-                                from_number, response_message, "text",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
-                            )
-
-                        return Response(content="Size selected", status_code=200)
-
-                    elif node_name == "handle_extras":
-                        current_state_dict.update(state_updates)
-                        current_state_dict["user_phone"] = from_number
-                        result = await cart_nodes.handle_extras_selection_node(current_state_dict)
-
-                        # Persist state updates back to graph
-                        await graph.aupdate_state(
-                            config={"configurable": {"thread_id": session_id}},
-                            values=result
-                        )
-
-                        message_obj = result.get("messages")
-                        response_message = message_obj.content if message_obj else "Extra added"
-                        interactive_comp = result.get("interactive_component")
-
-                        if interactive_comp:
-                            msg_type = "interactive_button" if interactive_comp.get("type") == "button" else "interactive_list"
-                            success = await send_response(
-                                from_number, response_message, msg_type,
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
-                                interactive_component=interactive_comp
-                            )
-                        else:
-                            success = await send_response(
-                                from_number, response_message, "text",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
-                            )
-
-                        return Response(content="Extra added", status_code=200)
-
-                    elif node_name == "handle_delivery_method":
-                        current_state_dict.update(state_updates)
-                        current_state_dict["user_phone"] = from_number
-                        result = await cart_nodes.handle_delivery_method_node(current_state_dict)
-
-                        # Persist state updates back to graph
-                        await graph.aupdate_state(
-                            config={"configurable": {"thread_id": session_id}},
-                            values=result
-                        )
-
-                        message_obj = result.get("messages")
-                        response_message = message_obj.content if message_obj else "Delivery selected"
-                        interactive_comp = result.get("interactive_component")
-
-                        if interactive_comp:
-                            msg_type = "interactive_list"
-                            success = await send_response(
-                                from_number, response_message, msg_type,
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
-                                interactive_component=interactive_comp
-                            )
-                        else:
-                            success = await send_response(
-                                from_number, response_message, "text",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
-                            )
-
-                        return Response(content="Delivery method selected", status_code=200)
-
-                    elif node_name == "handle_payment_method":
-                        current_state_dict.update(state_updates)
-                        current_state_dict["user_phone"] = from_number
-                        result = await cart_nodes.handle_payment_method_node(current_state_dict)
-
-                        # Persist state updates back to graph
-                        await graph.aupdate_state(
-                            config={"configurable": {"thread_id": session_id}},
-                            values=result
-                        )
-
-                        message_obj = result.get("messages")
-                        response_message = message_obj.content if message_obj else "Payment selected"
-                        interactive_comp = result.get("interactive_component")
-
-                        if interactive_comp:
-                            logger.info(f"Sending order confirmation component: {interactive_comp.get('type')}")
-                            success = await send_response(
-                                from_number, response_message, "interactive_button",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
-                                interactive_component=interactive_comp
-                            )
-                            if not success:
-                                logger.error("Failed to send order confirmation interactive message")
-                        else:
-                            success = await send_response(
-                                from_number, response_message, "text",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
-                            )
-
-                        return Response(content="Payment method selected", status_code=200)
-
-                    elif node_name == "confirm_order":
-                        result = await cart_nodes.confirm_order_node(current_state_dict)
-
-                        # Persist state updates back to graph
-                        await graph.aupdate_state(
-                            config={"configurable": {"thread_id": session_id}},
-                            values=result
-                        )
-
-                        message_obj = result.get("messages")
-                        response_message = message_obj.content if message_obj else "Order confirmed!"
-                        interactive_comp = result.get("interactive_component")
-
-                        if interactive_comp:
-                            success = await send_response(
-                                from_number, response_message, "interactive_button",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
-                                interactive_component=interactive_comp
-                            )
-                        else:
-                            success = await send_response(
-                                from_number, response_message, "text",
-                                phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
-                            )
-
-                        return Response(content="Order confirmed", status_code=200)
-
                     else:
                         # Not a cart interaction or fallback to conversation
                         # Use text representation for conversation flow
@@ -607,9 +419,6 @@ async def whatsapp_handler(request: Request) -> Response:
 
             elif message["type"] == "location":
                 # User shared their location
-                from .location_components import format_location_for_display
-                from ai_companion.interfaces.whatsapp.interactive_components import create_payment_method_list
-
                 location_data = message.get("location", {})
                 latitude = location_data.get("latitude")
                 longitude = location_data.get("longitude")
@@ -703,8 +512,6 @@ async def whatsapp_handler(request: Request) -> Response:
 
                 # Check if this is a cart action from WhatsApp deep link (e.g., "add_pizzas_0")
                 # This allows carousel buttons to directly trigger cart actions
-                from ai_companion.interfaces.whatsapp.cart_handler import CartInteractionHandler
-
                 if CartInteractionHandler.is_cart_interaction(content):
                     # Treat text message as if it were an interactive button
                     logger.info(f"Detected cart action from deep link: {content}")
@@ -746,7 +553,7 @@ async def whatsapp_handler(request: Request) -> Response:
                                 # Find category by ID or name
                                 selected_category = None
                                 if category_id and category_id.startswith("cat_"):
-                                    api_category_id = category_id.replace("cat_", "")
+                                    api_category_id = category_id[len("cat_"):]
                                     for cat in categories:
                                         if cat.get("id") == api_category_id:
                                             selected_category = cat
@@ -1037,6 +844,67 @@ async def whatsapp_handler(request: Request) -> Response:
         return Response(content="OK", status_code=200)
 
 
+async def _run_cart_node(
+    route: _CartNodeRoute,
+    current_state_dict: Dict,
+    state_updates: Dict,
+    graph,
+    session_id: str,
+    from_number: str,
+    phone_number_id: Optional[str],
+    whatsapp_token: Optional[str],
+) -> Response:
+    """Run a routed cart node, persist its state and send its reply.
+
+    Args:
+        route: Entry from ``_CART_NODE_ROUTES``
+        current_state_dict: Graph state loaded for this session
+        state_updates: State updates returned by the cart interaction handler
+        graph: Compiled graph bound to the session checkpointer
+        session_id: Graph thread ID
+        from_number: Customer phone number
+        phone_number_id: WhatsApp phone number ID
+        whatsapp_token: WhatsApp access token
+
+    Returns:
+        Acknowledgement response for the webhook
+    """
+    if route.apply_updates:
+        current_state_dict.update(state_updates)
+    current_state_dict["user_phone"] = from_number
+    result = await route.node(current_state_dict)
+
+    # Persist state updates back to graph
+    await graph.aupdate_state(
+        config={"configurable": {"thread_id": session_id}},
+        values=result
+    )
+
+    # Send response (messages is a single AIMessage object, not a list)
+    message_obj = result.get("messages")
+    response_message = message_obj.content if message_obj else route.fallback_text
+    interactive_comp = result.get("interactive_component")
+
+    if interactive_comp:
+        msg_type = route.msg_type
+        if msg_type is None:
+            msg_type = "interactive_button" if interactive_comp.get("type") == "button" else "interactive_list"
+        success = await send_response(
+            from_number, response_message, msg_type,
+            phone_number_id=phone_number_id, whatsapp_token=whatsapp_token,
+            interactive_component=interactive_comp
+        )
+        if not success:
+            logger.error(f"Failed to send {msg_type} message for cart node {route.node.__name__}")
+    else:
+        await send_response(
+            from_number, response_message, "text",
+            phone_number_id=phone_number_id, whatsapp_token=whatsapp_token
+        )
+
+    return Response(content=route.ack, status_code=200)
+
+
 async def track_bot_response(
     conversation_session_id: Optional[str],
     business_subdomain: str,
@@ -1288,8 +1156,6 @@ async def send_response(
 
     elif message_type == "location":
         # Send a location message with coordinates
-        from .location_components import create_location_message_payload
-
         if latitude is None or longitude is None:
             logger.error("Latitude and longitude are required for location messages")
             return False
@@ -1310,8 +1176,6 @@ async def send_response(
 
     elif message_type == "location_request":
         # Request user's location using interactive message
-        from .location_components import create_location_request_component
-
         json_data = {
             "messaging_product": "whatsapp",
             "recipient_type": "individual",
@@ -1353,13 +1217,16 @@ async def send_response(
         }
 
     logger.debug(f"Sending message to {from_number} via phone number ID: {phone_id}")
-    logger.debug(f"Message data: {json_data}")
+    # Lazy formatting: interactive payloads are large and debug is usually off
+    logger.debug("Message data: %s", json_data)
 
+    # Interactive lists and carousels make sizeable payloads; orjson encodes
+    # them several times faster than httpx's stdlib json
     async with httpx.AsyncClient() as client:
         response = await client.post(
             f"https://graph.facebook.com/v21.0/{phone_id}/messages",
             headers=headers,
-            json=json_data,
+            content=orjson.dumps(json_data),
         )
 
     if response.status_code != 200:
@@ -261,28 +261,24 @@ class CartService:
         if cart.is_empty:
             return "🛒 Votre panier est vide"
 
-        lines = ["🛒 *Votre panier:*\n"]
+        item_lines = "\n".join(self._format_cart_line(item) for item in cart.items)
 
-        for item in cart.items:
-            size_text = (
-                f" ({item.customization.size})"
-                if item.customization and item.customization.size
-                else ""
-            )
-            extras_text = ""
-            if item.customization and item.customization.extras:
-                extras_text = (
-                    f"\n   ↳ _Extras: {', '.join(item.customization.extras)}_"
-                )
-
-            lines.append(
-                f"• {item.quantity}x {item.name}{size_text} - ${item.item_total:.2f}{extras_text}"
-            )
+        return (
+            f"🛒 *Votre panier:*\n\n{item_lines}\n"
+            f"\n*Sous Total:* ${cart.subtotal:.2f}\n"
+            f"*Articles:* {cart.item_count}"
+        )
 
-        lines.append(f"\n*Sous Total:* ${cart.subtotal:.2f}")
-        lines.append(f"*Articles:* {cart.item_count}")
+    @staticmethod
+    def _format_cart_line(item: CartItem) -> str:
+        """Format a single cart item line for the cart summary."""
+        customization = item.customization
+        size_text = f" ({customization.size})" if customization and customization.size else ""
+        extras_text = ""
+        if customization and customization.extras:
+            extras_text = f"\n   ↳ _Extras: {', '.join(customization.extras)}_"
 
-        return "\n".join(lines)
+        return f"• {item.quantity}x {item.name}{size_text} - ${item.item_total:.2f}{extras_text}"
 
     async def create_order_from_cart(
         self,
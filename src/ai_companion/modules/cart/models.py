@@ -47,18 +47,26 @@ class PaymentMethod(Enum):
     ONLINE = "online"
 
 
-@dataclass
+@dataclass(slots=True)
 class CartItemCustomization:
-    """Customization options for a cart item."""
+    """Customization options for a cart item.
+
+    The field set is fixed, so the class uses slots for compact instances
+    and faster attribute access during cart comparisons and pricing.
+    """
     size: Optional[str] = None  # "small", "medium", "large"
     extras: List[str] = field(default_factory=list)  # ["extra_cheese", "mushrooms"]
     special_instructions: Optional[str] = None
     price_adjustment: float = 0.0  # Additional cost for customizations
 
 
-@dataclass
+@dataclass(slots=True)
 class CartItem:
-    """Individual item in the shopping cart."""
+    """Individual item in the shopping cart.
+
+    Like CartItemCustomization, the class uses slots: carts hold many items
+    and pricing reads their fields repeatedly.
+    """
     id: str
     menu_item_id: str
     name: str
@@ -191,14 +199,15 @@ class ShoppingCart:
     @classmethod
     def from_dict(cls, data: Dict) -> "ShoppingCart":
         """Create ShoppingCart from dictionary."""
-        from datetime import datetime
+        created_at = data.get("created_at")
+        updated_at = data.get("updated_at")
 
-        cart = cls(cart_id=data["cart_id"])
-        cart.items = [CartItem.from_dict(item_data) for item_data in data.get("items", [])]
-        cart.created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now()
-        cart.updated_at = datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else datetime.now()
-
-        return cart
+        return cls(
+            cart_id=data["cart_id"],
+            items=[CartItem.from_dict(item_data) for item_data in data.get("items", [])],
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else datetime.now(),
+        )
 
 
 @dataclass
@@ -343,6 +343,13 @@ def format_order_summary(order: Order) -> str:
     return "\n".join(lines)
 
 
+# The optional order line is formatted in as an empty string when absent
+_ORDER_ERROR_TEMPLATE = (
+    "❌ *Order Error*\n\n{order_line}{error_message}\n\n"
+    "Please try again or contact support if the issue persists."
+)
+
+
 def format_order_error(error_message: str, order_id: Optional[str] = None) -> str:
     """Format order error message.
 
@@ -353,12 +360,5 @@ def format_order_error(error_message: str, order_id: Optional[str] = None) -> st
     Returns:
         Formatted error message
     """
-    lines = ["❌ *Order Error*\n"]
-
-    if order_id:
-        lines.append(f"Order: {order_id}\n")
-
-    lines.append(f"{error_message}")
-    lines.append("\nPlease try again or contact support if the issue persists.")
-
-    return "\n".join(lines)
+    order_line = f"Order: {order_id}\n\n" if order_id else ""
+    return _ORDER_ERROR_TEMPLATE.format(order_line=order_line, error_message=error_message)
@@ -11,7 +11,7 @@ from groq import Groq
 class ImageToText:
     """A class to handle image-to-text conversion using Groq's vision capabilities."""
 
-    REQUIRED_ENV_VARS = ["GROQ_API_KEY"]
+    REQUIRED_ENV_VARS = ("GROQ_API_KEY",)
 
     def __init__(self):
         """Initialize the ImageToText class and validate environment variables."""
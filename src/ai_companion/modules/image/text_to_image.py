@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import logging
 import os
@@ -31,7 +32,7 @@ class EnhancedPrompt(BaseModel):
 class TextToImage:
     """A class to handle text-to-image generation using Together AI."""
 
-    REQUIRED_ENV_VARS = ["GROQ_API_KEY", "TOGETHER_API_KEY"]
+    REQUIRED_ENV_VARS = ("GROQ_API_KEY", "TOGETHER_API_KEY")
 
     def __init__(self):
         """Initialize the TextToImage class and validate environment variables."""
@@ -60,7 +61,10 @@ class TextToImage:
         try:
             self.logger.info(f"Generating image for prompt: '{prompt}'")
 
-            response = self.together_client.images.generate(
+            # The Together client is synchronous; run it in a worker thread so
+            # generation can overlap with other awaits
+            response = await asyncio.to_thread(
+                self.together_client.images.generate,
                 prompt=prompt,
                 model=settings.TTI_MODEL_NAME,
                 width=1024,
@@ -73,9 +77,7 @@ class TextToImage:
             image_data = base64.b64decode(response.data[0].b64_json)
 
             if output_path:
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                with open(output_path, "wb") as f:
-                    f.write(image_data)
+                await asyncio.to_thread(self._save_image, output_path, image_data)
                 self.logger.info(f"Image saved to {output_path}")
 
             return image_data
@@ -83,6 +85,13 @@ class TextToImage:
         except Exception as e:
             raise TextToImageError(f"Failed to generate image: {str(e)}") from e
 
+    @staticmethod
+    def _save_image(output_path: str, image_data: bytes) -> None:
+        """Write image bytes to disk; blocking, so run off the event loop."""
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(image_data)
+
     async def create_scenario(self, chat_history: list = None) -> ScenarioPrompt:
         """Creates a first-person narrative scenario and corresponding image prompt based on chat history."""
         try:
@@ -107,7 +116,7 @@ class TextToImage:
                 | structured_llm
             )
 
-            scenario = chain.invoke({"chat_history": formatted_history})
+            scenario = await chain.ainvoke({"chat_history": formatted_history})
             self.logger.info(f"Created scenario: {scenario}")
 
             return scenario
@@ -137,7 +146,7 @@ class TextToImage:
                 | structured_llm
             )
 
-            enhanced_prompt = chain.invoke({"prompt": prompt}).content
+            enhanced_prompt = (await chain.ainvoke({"prompt": prompt})).content
             self.logger.info(f"Enhanced prompt: '{enhanced_prompt}'")
 
             return enhanced_prompt
@@ -1,15 +1,28 @@
+import asyncio
 import logging
+import re
 import uuid
 from datetime import datetime
 from typing import List, Optional
 
 from ai_companion.core.prompts import MEMORY_ANALYSIS_PROMPT
-from ai_companion.modules.memory.long_term.vector_store import get_vector_store
+from ai_companion.modules.memory.long_term.vector_store import Memory, get_vector_store
 from ai_companion.settings import settings
 from langchain_core.messages import BaseMessage
 from langchain_groq import ChatGroq
 from pydantic import BaseModel, Field
 
+# Short replies that never carry anything worth remembering; these skip the
+# memory-analysis LLM call entirely
+_TRIVIAL_MESSAGES = frozenset({
+    "ok", "okay", "k", "yes", "yeah", "yep", "no", "nope", "sure",
+    "thanks", "thank you", "thx", "hi", "hello", "hey", "bye", "goodbye",
+    "si", "sí", "gracias", "hola", "vale", "oui", "merci", "bonjour",
+})
+
+# Action ids the webhook forwards verbatim (e.g. "retry_payment")
+_ACTION_ID_RE = re.compile(r"[a-z]+(?:_[a-z0-9]+)+")
+
 
 class MemoryAnalysis(BaseModel):
     """Result of analyzing a message for memory-worthy content."""
@@ -34,6 +47,18 @@ class MemoryManager:
             max_retries=2,
         ).with_structured_output(MemoryAnalysis)
 
+    @staticmethod
+    def _is_trivial(content) -> bool:
+        """Check whether a message is too short or generic to hold a memory."""
+        if not isinstance(content, str):
+            return False
+        normalized = content.strip().strip("!.?,").strip().lower()
+        return not normalized or normalized in _TRIVIAL_MESSAGES or _ACTION_ID_RE.fullmatch(normalized) is not None
+
+    def is_memory_candidate(self, message: BaseMessage) -> bool:
+        """Check whether a message is worth analyzing for memories."""
+        return message.type == "human" and not self._is_trivial(message.content)
+
     async def _analyze_memory(self, message: str) -> MemoryAnalysis:
         """Analyze a message to determine importance and format if needed."""
         prompt = MEMORY_ANALYSIS_PROMPT.format(message=message)
@@ -41,14 +66,15 @@ class MemoryManager:
 
     async def extract_and_store_memories(self, message: BaseMessage) -> None:
         """Extract important information from a message and store in vector store."""
-        if message.type != "human":
+        if not self.is_memory_candidate(message):
             return
 
         # Analyze the message for importance and formatting
         analysis = await self._analyze_memory(message.content)
         if analysis.is_important and analysis.formatted_memory:
-            # Check if similar memory exists
-            similar = self.vector_store.find_similar_memory(analysis.formatted_memory)
+            # Check if similar memory exists. Embedding and Qdrant calls block,
+            # so they run in a worker thread to keep the event loop free.
+            similar = await asyncio.to_thread(self.vector_store.find_similar_memory, analysis.formatted_memory)
             if similar:
                 # Skip storage if we already have a similar memory
                 self.logger.info(f"Similar memory already exists: '{analysis.formatted_memory}'")
@@ -56,7 +82,8 @@ class MemoryManager:
 
             # Store new memory
             self.logger.info(f"Storing new memory: '{analysis.formatted_memory}'")
-            self.vector_store.store_memory(
+            await asyncio.to_thread(
+                self.vector_store.store_memory,
                 text=analysis.formatted_memory,
                 metadata={
                     "id": str(uuid.uuid4()),
@@ -66,10 +93,15 @@ class MemoryManager:
 
     def get_relevant_memories(self, context: str) -> List[str]:
         """Retrieve relevant memories based on the current context."""
-        memories = self.vector_store.search_memories(context, k=settings.MEMORY_TOP_K)
-        if memories:
-            for memory in memories:
-                self.logger.debug(f"Memory: '{memory.text}' (score: {memory.score:.2f})")
+        return self._memory_texts(self.vector_store.search_memories(context, k=settings.MEMORY_TOP_K))
+
+    async def aget_relevant_memories(self, context: str) -> List[str]:
+        """Async variant of get_relevant_memories; batches concurrent lookups."""
+        return self._memory_texts(await self.vector_store.asearch_memories(context, k=settings.MEMORY_TOP_K))
+
+    def _memory_texts(self, memories: List[Memory]) -> List[str]:
+        for memory in memories:
+            self.logger.debug(f"Memory: '{memory.text}' (score: {memory.score:.2f})")
         return [memory.text for memory in memories]
 
     def format_memories_for_prompt(self, memories: List[str]) -> str:
@@ -1,8 +1,11 @@
+import asyncio
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ai_companion.settings import settings
 from qdrant_client import QdrantClient
@@ -10,9 +13,13 @@ from qdrant_client.models import Distance, PointStruct, VectorParams
 from sentence_transformers import SentenceTransformer
 
 
-@dataclass
+@dataclass(slots=True)
 class Memory:
-    """Represents a memory entry in the vector store."""
+    """Represents a memory entry in the vector store.
+
+    One is created per search hit, so the class uses slots for compact
+    instances.
+    """
 
     text: str
     metadata: dict
@@ -28,16 +35,71 @@ class Memory:
         return datetime.fromisoformat(ts) if ts else None
 
 
+class EmbeddingBatcher:
+    """Coalesces embedding requests made within a short window into one model call.
+
+    Concurrent conversation turns each need a query embedding; encoding them
+    as a single batch amortizes the model's per-call overhead.
+    """
+
+    def __init__(self, model: SentenceTransformer, window_seconds: float = 0.01, max_batch_size: int = 32):
+        self.model = model
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong references so in-flight encodes aren't garbage collected
+        self._tasks: set = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed ``text`` together with any other requests in the current window."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._encode(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _encode(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            vectors = await asyncio.to_thread(self.model.encode, [text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector.tolist())
+
+
 class VectorStore:
     """A class to handle vector storage operations using Qdrant."""
 
-    REQUIRED_ENV_VARS = ["QDRANT_URL", "QDRANT_API_KEY"]
+    REQUIRED_ENV_VARS = ("QDRANT_URL", "QDRANT_API_KEY")
     EMBEDDING_MODEL = "all-MiniLM-L6-v2"
     COLLECTION_NAME = "long_term_memory"
     SIMILARITY_THRESHOLD = 0.9  # Threshold for considering memories as similar
+    EMBEDDING_CACHE_SIZE = 1024
 
     _instance: Optional["VectorStore"] = None
     _initialized: bool = False
+    _collection_ready: bool = False
 
     def __new__(cls) -> "VectorStore":
         if cls._instance is None:
@@ -49,6 +111,10 @@ class VectorStore:
             self._validate_env_vars()
             self.model = SentenceTransformer(self.EMBEDDING_MODEL)
             self.client = QdrantClient(url=settings.QDRANT_URL, api_key=settings.QDRANT_API_KEY)
+            self.embedding_batcher = EmbeddingBatcher(self.model)
+            # text -> embedding, in LRU order; shared by worker threads and the loop
+            self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+            self._embeddings_lock = threading.Lock()
             self._initialized = True
 
     def _validate_env_vars(self) -> None:
@@ -58,13 +124,49 @@ class VectorStore:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
 
     def _collection_exists(self) -> bool:
-        """Check if the memory collection exists."""
-        collections = self.client.get_collections().collections
-        return any(col.name == self.COLLECTION_NAME for col in collections)
+        """Check if the memory collection exists.
+
+        Collections are never dropped at runtime, so a positive answer is
+        remembered and later checks skip the Qdrant round-trip.
+        """
+        if not self._collection_ready:
+            collections = self.client.get_collections().collections
+            self._collection_ready = any(col.name == self.COLLECTION_NAME for col in collections)
+        return self._collection_ready
+
+    def _cached_embedding(self, text: str) -> Optional[List[float]]:
+        """Return the remembered embedding of ``text``, if any."""
+        with self._embeddings_lock:
+            embedding = self._embeddings.get(text)
+            if embedding is not None:
+                self._embeddings.move_to_end(text)
+            return embedding
+
+    def _remember_embedding(self, text: str, embedding: List[float]) -> None:
+        with self._embeddings_lock:
+            self._embeddings[text] = embedding
+            self._embeddings.move_to_end(text)
+            if len(self._embeddings) > self.EMBEDDING_CACHE_SIZE:
+                self._embeddings.popitem(last=False)
+
+    def _embed(self, text: str) -> List[float]:
+        """Embed text, reusing the vector for recently seen texts.
+
+        store_memory embeds the same text for the duplicate check and the
+        upsert, and identical memory-injection contexts (e.g. repeated short
+        messages) re-query with the same text, so repeats skip the model.
+        asearch_memories shares the same cache. Callers must not mutate the
+        returned list.
+        """
+        embedding = self._cached_embedding(text)
+        if embedding is None:
+            embedding = self.model.encode(text).tolist()
+            self._remember_embedding(text, embedding)
+        return embedding
 
     def _create_collection(self) -> None:
         """Create a new collection for storing memories."""
-        sample_embedding = self.model.encode("sample text")
+        sample_embedding = self._embed("sample text")
         self.client.create_collection(
             collection_name=self.COLLECTION_NAME,
             vectors_config=VectorParams(
@@ -72,6 +174,7 @@ class VectorStore:
                 distance=Distance.COSINE,
             ),
         )
+        self._collection_ready = True
 
     def find_similar_memory(self, text: str) -> Optional[Memory]:
         """Find if a similar memory already exists.
@@ -102,10 +205,9 @@ class VectorStore:
         if similar_memory and similar_memory.id:
             metadata["id"] = similar_memory.id  # Keep same ID for update
 
-        embedding = self.model.encode(text)
         point = PointStruct(
             id=metadata.get("id", hash(text)),
-            vector=embedding.tolist(),
+            vector=self._embed(text),
             payload={
                 "text": text,
                 **metadata,
@@ -127,13 +229,36 @@ class VectorStore:
         Returns:
             List of Memory objects
         """
+        return self._query_memories(self._embed(query), k)
+
+    async def asearch_memories(self, query: str, k: int = 5) -> List[Memory]:
+        """Search for similar memories without blocking the event loop.
+
+        Recently seen queries reuse their cached embedding; others are
+        embedded through the shared EmbeddingBatcher, so concurrent searches
+        share one model call. The Qdrant query runs in a worker thread.
+
+        Args:
+            query: Text to search for
+            k: Number of results to return
+
+        Returns:
+            List of Memory objects
+        """
+        query_embedding = self._cached_embedding(query)
+        if query_embedding is None:
+            query_embedding = await self.embedding_batcher.embed(query)
+            self._remember_embedding(query, query_embedding)
+        return await asyncio.to_thread(self._query_memories, query_embedding, k)
+
+    def _query_memories(self, query_embedding: List[float], k: int) -> List[Memory]:
+        """Return the k memories closest to an embedded query."""
         if not self._collection_exists():
             return []
 
-        query_embedding = self.model.encode(query)
         results = self.client.query_points(
             collection_name=self.COLLECTION_NAME,
-            query=query_embedding.tolist(),
+            query=query_embedding,
             limit=k,
         ).points
 
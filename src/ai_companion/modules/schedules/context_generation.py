@@ -1,16 +1,71 @@
-from datetime import datetime
-from typing import Optional
+import time as _time
+from datetime import datetime, time
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from ai_companion.core.schedules import BUSINESS_HOURS, RESTAURANT_INFO, SPECIAL_OFFERS
 
+# Lowercase day names indexed by datetime.weekday(), matching BUSINESS_HOURS keys
+_WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
 
 class ScheduleContextGenerator:
     """Class to generate context about restaurant status and current offers."""
 
+    # get_current_activity() runs several times per turn; the status only
+    # changes at opening/closing time (HH:MM), so reuse the result within the
+    # same wall-clock minute
+    ACTIVITY_BUCKET_SECONDS = 60
+    _cached_activity: Optional[Tuple[int, str]] = None
+
     @staticmethod
-    def _parse_time(time_str: str) -> datetime.time:
-        """Parse a time string (e.g., '11:00') into a time object."""
-        return datetime.strptime(time_str, "%H:%M").time()
+    def _parse_time(time_str: str) -> time:
+        """Parse a time string (e.g., '11:00') into a time object.
+
+        Raises:
+            ValueError: If the string is not in HH:MM form
+        """
+        hour, separator, minute = time_str.partition(":")
+        if not separator:
+            raise ValueError(f"Invalid time string: {time_str!r}")
+        return time(int(hour), int(minute))
+
+    @classmethod
+    @lru_cache(maxsize=len(_WEEKDAY_NAMES))
+    def _get_day_context(cls, day_name: str) -> Tuple[str, Optional[dict], Optional[Tuple], str]:
+        """Precompute the parts of the context that only depend on the day.
+
+        Args:
+            day_name: Lowercase day name (e.g., 'monday')
+
+        Returns:
+            Tuple of (header, hours, (open_time, close_time) or None, footer)
+        """
+        hours = BUSINESS_HOURS.get(day_name, {})
+
+        # Build restaurant info context
+        header = (
+            f"Restaurant: {RESTAURANT_INFO['name']}\n"
+            f"Address: {RESTAURANT_INFO['address']}\n"
+            f"Phone: {RESTAURANT_INFO['phone']}\n"
+        )
+
+        opening_window = None
+        if hours.get("is_open", False):
+            opening_window = (cls._parse_time(hours["open"]), cls._parse_time(hours["close"]))
+
+        # Add delivery/pickup info
+        footer = ""
+        if RESTAURANT_INFO["delivery_available"]:
+            footer += f"Delivery: Available (${RESTAURANT_INFO['delivery_fee']:.2f} fee, free over ${RESTAURANT_INFO['free_delivery_minimum']:.2f})\n"
+        if RESTAURANT_INFO["pickup_available"]:
+            footer += f"Pickup: Available\n"
+
+        # Add today's special
+        if day_name in SPECIAL_OFFERS["daily_specials"]:
+            footer += f"Today's Special: {SPECIAL_OFFERS['daily_specials'][day_name]}\n"
+
+        return header, hours, opening_window, footer
 
     @classmethod
     def get_current_activity(cls) -> str:
@@ -19,39 +74,35 @@ class ScheduleContextGenerator:
         Returns:
             str: Description of current restaurant status and offers
         """
+        bucket = int(_time.time() // cls.ACTIVITY_BUCKET_SECONDS)
+        cached = cls._cached_activity
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
+
+        activity = cls._build_current_activity()
+        cls._cached_activity = (bucket, activity)
+        return activity
+
+    @classmethod
+    def _build_current_activity(cls) -> str:
+        """Compute the current status and offers without caching."""
         # Get current time and day of week
         current_datetime = datetime.now()
         current_time = current_datetime.time()
-        current_day_name = current_datetime.strftime("%A").lower()
-
-        # Get business hours for today
-        hours = BUSINESS_HOURS.get(current_day_name, {})
+        current_day_name = _WEEKDAY_NAMES[current_datetime.weekday()]
 
-        # Build restaurant info context
-        context = f"Restaurant: {RESTAURANT_INFO['name']}\n"
-        context += f"Address: {RESTAURANT_INFO['address']}\n"
-        context += f"Phone: {RESTAURANT_INFO['phone']}\n"
+        # Everything except the open/closed status is fixed for the day
+        header, hours, opening_window, footer = cls._get_day_context(current_day_name)
 
         # Check if open
-        if hours.get("is_open", False):
-            open_time = cls._parse_time(hours["open"])
-            close_time = cls._parse_time(hours["close"])
+        if opening_window is not None:
+            open_time, close_time = opening_window
 
             if open_time <= current_time <= close_time:
-                context += f"Status: OPEN (closes at {hours['close']})\n"
+                status = f"Status: OPEN (closes at {hours['close']})\n"
             else:
-                context += f"Status: CLOSED (opens at {hours['open']})\n"
+                status = f"Status: CLOSED (opens at {hours['open']})\n"
         else:
-            context += "Status: CLOSED today\n"
-
-        # Add delivery/pickup info
-        if RESTAURANT_INFO["delivery_available"]:
-            context += f"Delivery: Available (${RESTAURANT_INFO['delivery_fee']:.2f} fee, free over ${RESTAURANT_INFO['free_delivery_minimum']:.2f})\n"
-        if RESTAURANT_INFO["pickup_available"]:
-            context += f"Pickup: Available\n"
-
-        # Add today's special
-        if current_day_name in SPECIAL_OFFERS["daily_specials"]:
-            context += f"Today's Special: {SPECIAL_OFFERS['daily_specials'][current_day_name]}\n"
+            status = "Status: CLOSED today\n"
 
-        return context
+        return header + status + footer
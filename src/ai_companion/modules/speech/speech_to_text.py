@@ -11,7 +11,7 @@ class SpeechToText:
     """A class to handle speech-to-text conversion using Groq's Whisper model."""
 
     # Required environment variables
-    REQUIRED_ENV_VARS = ["GROQ_API_KEY"]
+    REQUIRED_ENV_VARS = ("GROQ_API_KEY",)
 
     def __init__(self):
         """Initialize the SpeechToText class and validate environment variables."""
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import Optional
 
@@ -10,7 +11,7 @@ class TextToSpeech:
     """A class to handle text-to-speech conversion using ElevenLabs."""
 
     # Required environment variables
-    REQUIRED_ENV_VARS = ["ELEVENLABS_API_KEY", "ELEVENLABS_VOICE_ID"]
+    REQUIRED_ENV_VARS = ("ELEVENLABS_API_KEY", "ELEVENLABS_VOICE_ID")
 
     def __init__(self):
         """Initialize the TextToSpeech class and validate environment variables."""
@@ -30,11 +31,31 @@ class TextToSpeech:
             self._client = ElevenLabs(api_key=settings.ELEVENLABS_API_KEY)
         return self._client
 
-    async def synthesize(self, text: str) -> bytes:
+    def _convert(self, text: str, previous_text: Optional[str] = None) -> bytes:
+        """Run the blocking ElevenLabs conversion and collect the audio."""
+        # Only sent when set, so single-shot requests are unchanged
+        context = {"previous_text": previous_text} if previous_text else {}
+        audio_generator = self.client.text_to_speech.convert(
+            voice_id=settings.ELEVENLABS_VOICE_ID,
+            text=text,
+            model_id=settings.TTS_MODEL_NAME,
+            voice_settings= VoiceSettings(
+                stability=0.5,
+                similarity_boost=0.5
+            ),
+            **context,
+        )
+
+        # Convert generator to bytes
+        return b"".join(audio_generator)
+
+    async def synthesize(self, text: str, previous_text: Optional[str] = None) -> bytes:
         """Convert text to speech using ElevenLabs.
 
         Args:
             text: Text to convert to speech
+            previous_text: Text spoken just before ``text``, when it continues an
+                earlier clip; keeps the voice's prosody continuous across clips
 
         Returns:
             bytes: Audio data
@@ -50,18 +71,9 @@ class TextToSpeech:
             raise ValueError("Input text exceeds maximum length of 5000 characters")
 
         try:
-            audio_generator = self.client.text_to_speech.convert(
-                voice_id=settings.ELEVENLABS_VOICE_ID,
-                text=text,
-                model_id=settings.TTS_MODEL_NAME,
-                voice_settings= VoiceSettings(
-                    stability=0.5,
-                    similarity_boost=0.5
-                )
-            )
-
-            # Convert generator to bytes
-            audio_bytes = b"".join(audio_generator)
+            # The ElevenLabs client is synchronous; run it in a worker thread
+            # so synthesis doesn't block other turns on the event loop
+            audio_bytes = await asyncio.to_thread(self._convert, text, previous_text)
             if not audio_bytes:
                 raise TextToSpeechError("Generated audio is empty")
 
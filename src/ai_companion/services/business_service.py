@@ -3,8 +3,10 @@ Business Service - Handles business credential lookup from MongoDB
 """
 import logging
 import os
+import re
 from typing import Optional, Dict, List
 from datetime import datetime
+from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
 from cryptography.fernet import Fernet
 import base64
@@ -12,6 +14,9 @@ import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Encrypted tokens are stored hex-encoded
+_HEX_TOKEN_RE = re.compile(r"[0-9a-fA-F]*")
+
 
 class BusinessService:
     """Service to interact with Business collection in MongoDB"""
@@ -90,7 +95,7 @@ class BusinessService:
             logger.error(f"Failed to decrypt token: {e}")
 
             # Check if it might be stored in plain text (fallback)
-            if len(encrypted_token) < 64 or not all(c in '0123456789abcdefABCDEF' for c in encrypted_token):
+            if len(encrypted_token) < 64 or not _HEX_TOKEN_RE.fullmatch(encrypted_token):
                 logger.warning("Token appears to be in plain text format")
                 return encrypted_token
 
@@ -226,7 +231,6 @@ class BusinessService:
             await self.connect()
 
         try:
-            from bson import ObjectId
             await self.db.businesses.update_one(
                 {"_id": ObjectId(business_id)},
                 {"$set": {"whatsappTokenExpiresAt": expires_at}}
@@ -4,6 +4,7 @@ Designed to handle 500+ concurrent requests across multiple businesses
 """
 import logging
 import os
+import re
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -11,11 +12,15 @@ from cryptography.fernet import Fernet
 import base64
 import hashlib
 import asyncio
+from collections import OrderedDict
 from functools import lru_cache
 import time
 
 logger = logging.getLogger(__name__)
 
+# Encrypted tokens are stored hex-encoded
+_HEX_TOKEN_RE = re.compile(r"[0-9a-fA-F]*")
+
 
 class BusinessCache:
     """In-memory LRU cache for business credentials with TTL"""
@@ -23,7 +28,8 @@ class BusinessCache:
     def __init__(self, max_size: int = 1000, ttl_seconds: int = 300):
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, tuple[Dict, float]] = {}
+        # Kept in write order, so the oldest entry is always first
+        self._cache: "OrderedDict[str, tuple[Dict, float]]" = OrderedDict()
         self._lock = asyncio.Lock()
 
     async def get(self, key: str) -> Optional[Dict]:
@@ -43,10 +49,11 @@ class BusinessCache:
     async def set(self, key: str, value: Dict):
         """Set cache entry with current timestamp"""
         async with self._lock:
-            # Simple LRU: if cache is full, remove oldest entry
-            if len(self._cache) >= self.max_size:
-                oldest_key = min(self._cache.items(), key=lambda x: x[1][1])[0]
-                del self._cache[oldest_key]
+            # If cache is full, remove oldest entry; overwriting doesn't grow it
+            if key in self._cache:
+                del self._cache[key]
+            elif len(self._cache) >= self.max_size:
+                self._cache.popitem(last=False)
 
             self._cache[key] = (value, time.time())
             logger.debug(f"Cache SET for key: {key}")
@@ -210,7 +217,7 @@ class OptimizedBusinessService:
             logger.error(f"Failed to decrypt token: {e}")
 
             # Check if it might be stored in plain text (fallback)
-            if len(encrypted_token) < 64 or not all(c in '0123456789abcdefABCDEF' for c in encrypted_token):
+            if len(encrypted_token) < 64 or not _HEX_TOKEN_RE.fullmatch(encrypted_token):
                 logger.warning("Token appears to be in plain text format")
                 return encrypted_token
 
@@ -1,6 +1,7 @@
 """Simple in-memory cache with TTL for API responses."""
 
 import asyncio
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
@@ -33,7 +34,8 @@ class MenuCache:
         self.ttl = timedelta(minutes=ttl_minutes)
         self.max_size = max_size
         self._cache: Dict[str, Any] = {}
-        self._timestamps: Dict[str, datetime] = {}
+        # Kept in write order, so the oldest entry is always first
+        self._timestamps: "OrderedDict[str, datetime]" = OrderedDict()
         self._lock = asyncio.Lock()
 
         # Statistics
@@ -63,12 +65,9 @@ class MenuCache:
     def _evict_if_needed(self):
         """Evict oldest entries if cache is full."""
         if len(self._cache) >= self.max_size:
-            # Find oldest entry
-            oldest_key = min(self._timestamps.keys(), key=lambda k: self._timestamps[k])
-
             # Remove oldest entry
+            oldest_key, _ = self._timestamps.popitem(last=False)
             self._cache.pop(oldest_key, None)
-            self._timestamps.pop(oldest_key, None)
             self.stats["evictions"] += 1
 
             logger.info(f"Cache evicted oldest entry: {oldest_key}")
@@ -108,8 +107,11 @@ class MenuCache:
             value: Value to cache
         """
         async with self._lock:
-            # Evict if cache is full
-            self._evict_if_needed()
+            # Evict if cache is full; overwriting a key doesn't grow it
+            if key in self._cache:
+                self._timestamps.pop(key)
+            else:
+                self._evict_if_needed()
 
             # Set value and timestamp
             self._cache[key] = value
@@ -142,7 +144,7 @@ class MenuCache:
         async with self._lock:
             # Convert wildcard pattern to simple matching
             if "*" in pattern:
-                prefix = pattern.split("*")[0]
+                prefix = pattern[:pattern.find("*")]
                 keys_to_remove = [k for k in self._cache.keys() if k.startswith(prefix)]
             else:
                 keys_to_remove = [pattern] if pattern in self._cache else []
@@ -2,6 +2,7 @@
 
 import aiohttp
 import asyncio
+import random
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 import logging
@@ -227,7 +228,6 @@ class CartaAIClient:
 
         elif self.rate_limit_strategy == RateLimitStrategy.ADAPTIVE:
             # Adaptive: exponential but with jitter
-            import random
             base_delay = self.retry_delay * (2 ** retry_count)
             jitter = random.uniform(0, base_delay * 0.1)  # Add up to 10% jitter
             return base_delay + jitter
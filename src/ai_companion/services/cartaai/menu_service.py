@@ -1,6 +1,7 @@
 """Menu service with caching for CartaAI API."""
 
 from typing import Dict, List, Optional, Any
+import asyncio
 import logging
 
 from .client import CartaAIClient
@@ -228,10 +229,11 @@ class MenuService:
         query_lower = query.lower()
         for category in categories:
             for product in category.get("products", []):
-                name = product.get("name", "").lower()
-                description = product.get("description", "").lower()
-
-                if query_lower in name or query_lower in description:
+                # Short-circuit so the description is only lowered when the name misses
+                if (
+                    query_lower in product.get("name", "").lower()
+                    or query_lower in product.get("description", "").lower()
+                ):
                     results.append(product)
 
         logger.info(f"Search '{query}' found {len(results)} products")
@@ -360,11 +362,13 @@ class MenuService:
                     if product_id:
                         all_product_ids.append(product_id)
 
-            # Load product details in batches
+            # Load product details in batches, fetched concurrently; the
+            # client's request semaphore bounds the number in flight
             batch_size = 10
-            for i in range(0, len(all_product_ids), batch_size):
-                batch = all_product_ids[i : i + batch_size]
-                await self.get_product_details(batch, force_refresh=True)
+            await asyncio.gather(*(
+                self.get_product_details(all_product_ids[i : i + batch_size], force_refresh=True)
+                for i in range(0, len(all_product_ids), batch_size)
+            ))
 
             logger.info(f"Preloaded {len(all_product_ids)} products")
 
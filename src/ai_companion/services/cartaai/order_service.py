@@ -319,49 +319,50 @@ def build_modifiers_from_extras(extras: List[str]) -> List[Dict]:
         return []
 
     # Check if extras are already in API format (start with "extra_")
-    # vs new format (start with "mod_")
-    if any(extra.startswith("mod_") for extra in extras):
+    # vs new format (start with "mod_"), grouping API options in the same pass
+    modifiers_dict = {}
+    has_api_format = False
+
+    for extra_id in extras:
+        if not extra_id.startswith("mod_"):
+            continue
+
+        has_api_format = True
         # Parse API format: mod_{modifierId}_{optionId}
-        modifiers_dict = {}
-
-        for extra_id in extras:
-            if extra_id.startswith("mod_"):
-                parts = extra_id.split("_")
-                if len(parts) >= 3:
-                    modifier_id = parts[1]
-                    option_id = "_".join(parts[2:])
-
-                    if modifier_id not in modifiers_dict:
-                        modifiers_dict[modifier_id] = {
-                            "modifierId": modifier_id,
-                            "name": "Extras",  # Placeholder name
-                            "options": []
-                        }
-
-                    modifiers_dict[modifier_id]["options"].append({
-                        "optionId": option_id,
-                        "name": option_id,  # Placeholder name
-                        "price": 0.0,  # Price already included in cart
-                        "quantity": 1
-                    })
+        # Option IDs may contain underscores; only split off the modifier
+        modifier_id, separator, option_id = extra_id[len("mod_"):].partition("_")
+        if separator:
+            if modifier_id not in modifiers_dict:
+                modifiers_dict[modifier_id] = {
+                    "modifierId": modifier_id,
+                    "name": "Extras",  # Placeholder name
+                    "options": []
+                }
+
+            modifiers_dict[modifier_id]["options"].append({
+                "optionId": option_id,
+                "name": option_id,  # Placeholder name
+                "price": 0.0,  # Price already included in cart
+                "quantity": 1
+            })
 
+    if has_api_format:
         return list(modifiers_dict.values())
 
-    else:
-        # Legacy format: create a single modifier with all extras
-        return [{
-            "modifierId": "legacy_extras",
-            "name": "Extras",
-            "options": [
-                {
-                    "optionId": extra_id,
-                    "name": extra_id.replace("_", " ").title(),
-                    "price": 0.0,  # Price already calculated
-                    "quantity": 1
-                }
-                for extra_id in extras
-            ]
-        }]
+    # Legacy format: create a single modifier with all extras
+    return [{
+        "modifierId": "legacy_extras",
+        "name": "Extras",
+        "options": [
+            {
+                "optionId": extra_id,
+                "name": extra_id.replace("_", " ").title(),
+                "price": 0.0,  # Price already calculated
+                "quantity": 1
+            }
+            for extra_id in extras
+        ]
+    }]
 
 
 def map_delivery_method_to_api(
@@ -183,6 +183,12 @@ class ProductIDMapper:
             api_products: List of API products
             legacy_products: List of legacy products
         """
+        # Lowercase API names once instead of once per legacy product
+        api_names = [
+            (api_product.get("name", "").lower(), api_product.get("id"))
+            for api_product in api_products
+        ]
+
         for index, legacy_product in enumerate(legacy_products):
             legacy_name = legacy_product.get("name", "").lower()
             legacy_id = f"{category_key}_{index}"
@@ -192,11 +198,8 @@ class ProductIDMapper:
                 continue
 
             # Find matching API product by name
-            for api_product in api_products:
-                api_name = api_product.get("name", "").lower()
-
+            for api_name, api_id in api_names:
                 if legacy_name == api_name or legacy_name in api_name:
-                    api_id = api_product.get("id")
                     if api_id and not self.get_legacy_id(api_id):
                         self.add_mapping(legacy_id, api_id)
                         break
@@ -24,6 +24,17 @@ from ai_companion.services.conversation_state_service import (
 
 logger = logging.getLogger(__name__)
 
+# Graph state values recognised when inferring the conversation intent
+_EXPLICIT_INTENTS = frozenset({"menu", "order", "support", "info", "payment", "delivery"})
+_ORDER_STAGES = frozenset({"cart", "selecting_items", "customizing", "awaiting_size", "awaiting_extras"})
+_DELIVERY_STAGES = frozenset({"checkout", "delivery", "awaiting_location"})
+_PAYMENT_STAGES = frozenset({"payment", "awaiting_payment", "awaiting_phone"})
+
+# Payment methods accepted by the conversation API as-is (lowercase)
+_API_PAYMENT_METHODS = frozenset({
+    "cash", "card", "transfer", "yape", "plin", "mercado_pago", "bank_transfer",
+})
+
 
 class ConversationStateManager:
     """
@@ -289,15 +300,15 @@ class ConversationStateManager:
         workflow = graph_state.get("workflow", "").lower()
 
         # Determine intent from various state indicators
-        if intent_str in ["menu", "order", "support", "info", "payment", "delivery"]:
+        if intent_str in _EXPLICIT_INTENTS:
             return ConversationIntent(intent_str)
 
         # Infer from order stage
-        if order_stage in ["cart", "selecting_items", "customizing", "awaiting_size", "awaiting_extras"]:
+        if order_stage in _ORDER_STAGES:
             return ConversationIntent.ORDER
-        elif order_stage in ["checkout", "delivery", "awaiting_location"]:
+        elif order_stage in _DELIVERY_STAGES:
             return ConversationIntent.DELIVERY
-        elif order_stage in ["payment", "awaiting_payment", "awaiting_phone"]:
+        elif order_stage in _PAYMENT_STAGES:
             return ConversationIntent.PAYMENT
 
         # Infer from workflow
@@ -357,17 +368,11 @@ class ConversationStateManager:
         # Extract payment method
         payment_method = graph_state.get("payment_method")
         if payment_method:
-            # Map payment method to enum value
-            payment_map = {
-                "cash": "cash",
-                "card": "card",
-                "transfer": "transfer",
-                "yape": "yape",
-                "plin": "plin",
-                "mercado_pago": "mercado_pago",
-                "bank_transfer": "bank_transfer"
-            }
-            context["paymentMethod"] = payment_map.get(payment_method.lower(), payment_method)
+            # Map payment method to enum value; unknown methods pass through
+            payment_method_lower = payment_method.lower()
+            context["paymentMethod"] = (
+                payment_method_lower if payment_method_lower in _API_PAYMENT_METHODS else payment_method
+            )
 
         # Extract customer information
         customer_name = graph_state.get("customer_name")
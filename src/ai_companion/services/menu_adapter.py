@@ -280,10 +280,11 @@ class MenuAdapter:
         for cat_key in categories_to_search:
             items = RESTAURANT_MENU.get(cat_key, [])
             for index, item in enumerate(items):
-                name = item.get("name", "").lower()
-                description = item.get("description", "").lower()
-
-                if query_lower in name or query_lower in description:
+                # Short-circuit so the description is only lowered when the name misses
+                if (
+                    query_lower in item.get("name", "").lower()
+                    or query_lower in item.get("description", "").lower()
+                ):
                     results.append(
                         {
                             "id": f"{cat_key}_{index}",
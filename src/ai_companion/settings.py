@@ -23,6 +23,11 @@ class Settings(BaseSettings):
 
     MEMORY_TOP_K: int = 3
     ROUTER_MESSAGES_TO_ANALYZE: int = 3
+    # Messages fed to the reply chains. Summarization runs once a turn ends with
+    # more than TOTAL_MESSAGES_SUMMARY_TRIGGER messages, so a reply normally sees
+    # at most trigger + 1 unsummarized messages; keep the window at least that
+    # large so nothing drops out before the summary covers it.
+    CONVERSATION_MESSAGES_WINDOW: int = 21
     TOTAL_MESSAGES_SUMMARY_TRIGGER: int = 20
     TOTAL_MESSAGES_AFTER_SUMMARY: int = 5
 
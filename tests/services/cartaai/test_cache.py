@@ -4,6 +4,7 @@ import pytest
 import asyncio
 from datetime import timedelta
 
+from ai_companion.services.business_service_optimized import BusinessCache
 from ai_companion.services.cartaai.cache import MenuCache
 
 
@@ -129,6 +130,33 @@ class TestMenuCache:
         result = await cache.get("key1")
         assert result is None
 
+    async def test_overwrite_when_full_does_not_evict(self):
+        """Test that overwriting a key in a full cache keeps every entry."""
+        cache = MenuCache(max_size=2)
+
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        await cache.set("key1", "value1b")
+
+        assert len(cache._cache) == 2
+        assert cache.stats["evictions"] == 0
+        assert await cache.get("key1") == "value1b"
+        assert await cache.get("key2") == "value2"
+
+    async def test_eviction_removes_oldest_write(self):
+        """Test that eviction removes the least recently written key."""
+        cache = MenuCache(max_size=2)
+
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        await cache.set("key1", "value1b")  # key2 is now the oldest write
+        await cache.set("key3", "value3")
+
+        assert cache.stats["evictions"] == 1
+        assert await cache.get("key2") is None
+        assert await cache.get("key1") == "value1b"
+        assert await cache.get("key3") == "value3"
+
     async def test_get_stats(self):
         """Test cache statistics."""
         cache = MenuCache()
@@ -208,3 +236,34 @@ class TestMenuCache:
         assert "MenuCache" in repr_str
         assert "ttl=10" in repr_str
         assert "max_size=100" in repr_str
+
+
+@pytest.mark.asyncio
+class TestBusinessCache:
+    """Test BusinessCache write-order eviction."""
+
+    async def test_overwrite_when_full_does_not_evict(self):
+        """Test that overwriting a key in a full cache keeps every entry."""
+        cache = BusinessCache(max_size=2)
+
+        await cache.set("key1", {"data": "value1"})
+        await cache.set("key2", {"data": "value2"})
+        await cache.set("key1", {"data": "value1b"})
+
+        assert len(cache._cache) == 2
+        assert await cache.get("key1") == {"data": "value1b"}
+        assert await cache.get("key2") == {"data": "value2"}
+
+    async def test_eviction_removes_oldest_write(self):
+        """Test that eviction removes the least recently written key."""
+        cache = BusinessCache(max_size=2)
+
+        await cache.set("key1", {"data": "value1"})
+        await cache.set("key2", {"data": "value2"})
+        await cache.set("key1", {"data": "value1b"})  # key2 is now the oldest write
+        await cache.set("key3", {"data": "value3"})
+
+        assert len(cache._cache) == 2
+        assert await cache.get("key2") is None
+        assert await cache.get("key1") == {"data": "value1b"}
+        assert await cache.get("key3") == {"data": "value3"}
@@ -0,0 +1,53 @@
+"""Tests for the checkout message cache in cart nodes."""
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from ai_companion.graph import cart_nodes
+from ai_companion.graph.utils import message_generator
+from ai_companion.modules.cart.models import CartItem, ShoppingCart
+
+
+@pytest.fixture(autouse=True)
+def cart_with_items(monkeypatch):
+    """Serve a one-item cart and start each test with an empty message cache."""
+    cart = ShoppingCart(items=[CartItem(id="item-1", menu_item_id="menu-1", name="Pizza", base_price=12.5)])
+    monkeypatch.setattr(cart_nodes, "get_or_create_cart", lambda state: cart)
+    cart_nodes._checkout_message_cache.clear()
+    yield
+    cart_nodes._checkout_message_cache.clear()
+
+
+def _chat_model(reply):
+    """Build a stand-in chat model that returns ``reply`` or raises it."""
+
+    def invoke(prompt_value):
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    return lambda temperature=0.5: RunnableLambda(invoke)
+
+
+@pytest.mark.asyncio
+async def test_checkout_fallback_is_not_cached(monkeypatch):
+    """Test that a failed generation serves the fallback without caching it."""
+    monkeypatch.setattr(message_generator, "get_chat_model", _chat_model(TimeoutError("rate limited")))
+
+    result = await cart_nodes.checkout_node({})
+
+    assert result["messages"].content == message_generator._get_fallback_message("checkout_start", {})
+    assert not cart_nodes._checkout_message_cache
+
+
+@pytest.mark.asyncio
+async def test_checkout_generated_message_is_cached(monkeypatch):
+    """Test that generated checkout text is reused for the same cart state."""
+    monkeypatch.setattr(message_generator, "get_chat_model", _chat_model(" Let's check out! "))
+
+    first = await cart_nodes.checkout_node({})
+    monkeypatch.setattr(message_generator, "get_chat_model", _chat_model(TimeoutError("rate limited")))
+    second = await cart_nodes.checkout_node({})
+
+    assert first["messages"].content == "Let's check out!"
+    assert second["messages"].content == "Let's check out!"
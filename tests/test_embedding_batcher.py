@@ -0,0 +1,57 @@
+"""Tests for the memory store's embedding batcher."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from ai_companion.modules.memory.long_term.vector_store import EmbeddingBatcher
+
+
+class FakeModel:
+    """Records each encode call and embeds a text as [len(text)]."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[float(len(text))] for text in texts])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_encode():
+    """Test that requests within the window are encoded in a single call."""
+    model = FakeModel()
+    batcher = EmbeddingBatcher(model)
+
+    vectors = await asyncio.gather(batcher.embed("hi"), batcher.embed("hello"))
+
+    assert vectors == [[2.0], [5.0]]
+    assert model.calls == [["hi", "hello"]]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_immediately():
+    """Test that reaching the batch size doesn't wait for the window."""
+    model = FakeModel()
+    batcher = EmbeddingBatcher(model, window_seconds=60, max_batch_size=2)
+
+    vectors = await asyncio.wait_for(asyncio.gather(batcher.embed("a"), batcher.embed("bb")), timeout=5)
+
+    assert vectors == [[1.0], [2.0]]
+
+
+@pytest.mark.asyncio
+async def test_encode_errors_reach_every_caller():
+    """Test that a failed batch fails each waiting request."""
+
+    class BrokenModel:
+        def encode(self, texts):
+            raise RuntimeError("model unavailable")
+
+    batcher = EmbeddingBatcher(BrokenModel())
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,66 @@
+"""Tests for the semantic cache in front of the character reply chain."""
+
+import numpy as np
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from ai_companion.graph import nodes
+from ai_companion.graph.utils import semantic_cache
+from ai_companion.graph.utils.semantic_cache import SemanticCache
+
+
+class FakeChain:
+    """Counts reply generations."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, payload, config):
+        self.calls += 1
+        return "Yes, we deliver!"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Use a fresh cache with a fixed embedding."""
+    cache = SemanticCache()
+    monkeypatch.setattr(nodes, "get_semantic_cache", lambda: cache)
+    monkeypatch.setattr(semantic_cache, "_embed", lambda text: np.array([1.0, 0.0]))
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_after_menu_turn(cache):
+    """Test that flags left in state by an earlier menu turn don't disable the cache."""
+    messages = [
+        HumanMessage(content="Show me the menu"),
+        AIMessage(content="Here's our menu!"),
+        HumanMessage(content="Do you deliver?"),
+    ]
+    state = {
+        "messages": messages,
+        "use_interactive_menu": True,
+        "interactive_component": {"type": "list"},
+    }
+    chain = FakeChain()
+
+    replies = [
+        await nodes._cached_reply(state, chain, {"messages": messages}, None, "conversation", "open", "")
+        for _ in range(2)
+    ]
+
+    assert replies == ["Yes, we deliver!", "Yes, we deliver!"]
+    assert chain.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_awaiting_location_bypasses_cache(cache):
+    """Test that a turn waiting for the customer's location is never cached."""
+    messages = [HumanMessage(content="Do you deliver?")]
+    state = {"messages": messages, "awaiting_location": True}
+    chain = FakeChain()
+
+    for _ in range(2):
+        await nodes._cached_reply(state, chain, {"messages": messages}, None, "conversation", "open", "")
+
+    assert chain.calls == 2
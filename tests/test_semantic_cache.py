@@ -0,0 +1,122 @@
+"""Tests for the conversation reply semantic cache."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from ai_companion.graph.utils import semantic_cache
+from ai_companion.graph.utils.semantic_cache import SemanticCache
+
+_VECTORS = {
+    "what time do you open?": np.array([1.0, 0.0]),
+    "when do you open?": np.array([0.99, 0.141]),
+    "do you deliver?": np.array([0.0, 1.0]),
+}
+
+
+@pytest.fixture(autouse=True)
+def fake_embeddings(monkeypatch):
+    """Replace the sentence-transformer with fixed unit vectors."""
+    monkeypatch.setattr(semantic_cache, "_embed", lambda text: _VECTORS[text])
+
+
+@pytest.mark.asyncio
+async def test_paraphrase_hits_within_scope():
+    """Test that a similar message in the same scope returns the cached reply."""
+    cache = SemanticCache(similarity_threshold=0.95)
+    await cache.set("What time do you open?", "scope", "We open at 11am.")
+
+    assert await cache.get("when do you  open?", "scope") == "We open at 11am."
+    assert await cache.get("Do you deliver?", "scope") is None
+
+
+@pytest.mark.asyncio
+async def test_scope_isolates_entries():
+    """Test that replies are never shared across scopes."""
+    cache = SemanticCache()
+    await cache.set("What time do you open?", "scope-a", "We open at 11am.")
+
+    assert await cache.get("What time do you open?", "scope-b") is None
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    """Test that the oldest entry is evicted once the cache is full."""
+    cache = SemanticCache(max_entries=1)
+    await cache.set("What time do you open?", "scope", "We open at 11am.")
+    await cache.set("Do you deliver?", "scope", "Yes!")
+
+    assert await cache.get("What time do you open?", "scope") is None
+    assert await cache.get("Do you deliver?", "scope") == "Yes!"
+
+
+def test_tagged_messages_not_cacheable():
+    """Test that stateful tagged messages bypass the cache."""
+    assert SemanticCache.is_cacheable("Do you deliver?")
+    assert not SemanticCache.is_cacheable("[User shared location: Main St]")
+    assert not SemanticCache.is_cacheable("   ")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_generation():
+    """Test that identical in-flight requests trigger a single generation."""
+    cache = SemanticCache()
+    calls = 0
+
+    async def generate():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "We open at 11am."
+
+    replies = await asyncio.gather(
+        cache.get_or_generate("What time do you open?", "scope", generate),
+        cache.get_or_generate("what time do you  open?", "scope", generate),
+    )
+
+    assert replies == ["We open at 11am.", "We open at 11am."]
+    assert calls == 1
+    assert await cache.get("What time do you open?", "scope") == "We open at 11am."
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_is_not_cached():
+    """Test that a failed generation propagates and stores nothing."""
+    cache = SemanticCache()
+
+    async def generate():
+        raise RuntimeError("model unavailable")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_generate("Do you deliver?", "scope", generate)
+
+    assert await cache.get("Do you deliver?", "scope") is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_owner_still_caches_shared_reply():
+    """Test that cancelling the caller that started a generation keeps its reply."""
+    cache = SemanticCache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def generate():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "We open at 11am."
+
+    owner = asyncio.create_task(cache.get_or_generate("What time do you open?", "scope", generate))
+    await asyncio.sleep(0)
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+    # A request arriving after the owner left joins the running generation
+    joiner = asyncio.create_task(cache.get_or_generate("what time do you open?", "scope", generate))
+    release.set()
+    assert await asyncio.wait_for(joiner, timeout=5) == "We open at 11am."
+
+    assert await cache.get_or_generate("What time do you open?", "scope", generate) == "We open at 11am."
+    assert calls == 1
@@ -0,0 +1,90 @@
+"""Tests for audio_node's streamed speech chunking."""
+
+import pytest
+
+from ai_companion.graph.nodes import _SpeechSynthesis, _stream_reply_with_speech
+
+FIRST = "Our margherita pizza is baked fresh in a wood-fired oven every single day. "
+SECOND = "It comes with basil and mozzarella. "
+THIRD = "Want one?"
+
+
+class FakeChain:
+    """Streams a fixed reply in small token-like pieces."""
+
+    def __init__(self, reply: str, piece: int = 7):
+        self.pieces = [reply[i : i + piece] for i in range(0, len(reply), piece)]
+
+    async def astream(self, payload, config):
+        for piece in self.pieces:
+            yield piece
+
+
+class FakeTextToSpeech:
+    """Records each synthesis request and returns the text as audio."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def synthesize(self, text, previous_text=None):
+        self.requests.append((text, previous_text))
+        return text.encode()
+
+
+async def _speak(reply: str):
+    text_to_speech = FakeTextToSpeech()
+    speech = _SpeechSynthesis(text_to_speech)
+    response = await _stream_reply_with_speech(FakeChain(reply), {}, None, speech)
+    return response, await speech.audio(), text_to_speech.requests
+
+
+@pytest.mark.asyncio
+async def test_chunks_cut_at_sentence_breaks_in_order():
+    """Test that chunks end at sentence breaks, reach the minimum and keep order."""
+    response, audio, requests = await _speak(FIRST + SECOND + THIRD)
+
+    assert [text for text, _ in requests] == [(FIRST + SECOND).strip(), THIRD]
+    assert audio == (FIRST + SECOND).strip().encode() + THIRD.encode()
+    assert response == (FIRST + SECOND + THIRD).strip()
+
+
+@pytest.mark.asyncio
+async def test_short_reply_is_one_chunk():
+    """Test that a reply under the minimum length is synthesized once."""
+    _, _, requests = await _speak(SECOND + THIRD)
+
+    assert requests == [((SECOND + THIRD).strip(), None)]
+
+
+@pytest.mark.asyncio
+async def test_never_cuts_inside_stage_direction():
+    """Test that sentence breaks inside *...* are not used as cut points."""
+    # The only break past the minimum length is inside the direction
+    direction = "*smiles warmly. She checks the order screen and nods. Then she looks up again* "
+    response, _, requests = await _speak(FIRST + direction + THIRD)
+
+    assert [text for text, _ in requests] == [response]
+    assert response == FIRST + " " + THIRD
+
+
+@pytest.mark.asyncio
+async def test_chunks_carry_previous_text():
+    """Test that each chunk is synthesized with the text spoken before it."""
+    _, _, requests = await _speak(FIRST + SECOND + FIRST + SECOND + THIRD)
+
+    assert requests[0][1] is None
+    for index in range(1, len(requests)):
+        assert requests[index][1] == " ".join(text for text, _ in requests[:index])
+
+
+@pytest.mark.asyncio
+async def test_cancel_ignores_later_chunks():
+    """Test that chunks arriving after cancellation start no synthesis."""
+    text_to_speech = FakeTextToSpeech()
+    speech = _SpeechSynthesis(text_to_speech)
+    speech.speak(FIRST)
+    speech.cancel()
+    speech.speak(SECOND)
+
+    assert len(speech.tasks) == 1
+    assert speech.tasks[0].cancelled() or speech.tasks[0].cancelling()